@@ -26,7 +26,7 @@ class Api:
         self._http = http
 
     def call_api(self, search_item, product, product_subtype, location=None, tile_product=None, year=None,
-                 return_period=None, event_id=None, extra_param=None):
+                 return_period=None, event_id=None, extra_param=None, model=None):
         """Receives an item, a product, a product subtype, and a location to create and call an endpoint to the First
         Street Foundation API.
 
@@ -41,8 +41,9 @@ class Api:
             return_period (int/None): The return period for probability depth tiles (if suitable)
             event_id (int/None): The event_id for historic tiles (if suitable)
             extra_param (dict): Extra parameter to be added to the url
+            model (class/None): A model to create from each JSON response as it is received
         Returns:
-            A list of JSON responses
+            A list of JSON responses, or of model objects if a model is given
         """
 
         # Not a list. This means it's should be a file
@@ -128,7 +129,7 @@ class Api:
 
         # Asynchronously call the API for each endpoint
         loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._http.endpoint_execute(endpoints))
+        response = loop.run_until_complete(self._http.endpoint_execute(endpoints, model))
 
         if product == "economic/aal":
             return zip(response, search_item)
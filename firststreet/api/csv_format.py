@@ -2,12 +2,16 @@
 # Copyright: This module is owned by First Street Foundation
 
 # Standard Imports
+import csv
 import datetime
+import itertools
 import logging
+import operator
 import os
 import pathlib
 
 # External Imports
+import numpy as np
 import pandas as pd
 import shapely.geometry
 
@@ -36,186 +40,459 @@ def to_csv(data, product, product_subtype, location_type=None, output_dir=None):
     if not output_dir:
         output_dir = pathlib.Path(os.getcwd()) / "output_data"
     output_dir = pathlib.Path(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = output_dir / file_name
+
+    # Formats with a row per object are written straight from the objects, without building a DataFrame
+    writer = _WRITERS.get((product, product_subtype, location_type))
+    if writer:
+        with _open_csv(output_path) as f:
+            writer(data, f)
+        logging.info("CSV generated to '{}'.".format(output_path))
+        return
+
+    # Format the data for each product, preferring a formatter specific to the location type
+    formatter = _FORMATTERS.get((product, product_subtype, location_type)) or \
+        _FORMATTERS.get((product, product_subtype, None))
+
+    if not formatter:
+        raise NotImplementedError
 
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    df = formatter(data)
 
-    # Format the data for each product
-    if product == 'adaptation':
+    with _open_csv(output_path) as f:
+        write_frame(df, f)
+    logging.info("CSV generated to '{}'.".format(output_path))
 
-        if product_subtype == 'detail':
-            df = format_adaptation_detail(data)
 
-        elif product_subtype == 'summary':
-            df = format_adaptation_summary(data)
+def _open_csv(path):
+    """Opens a CSV file for writing through a large buffer
 
-        elif product_subtype == 'summary_detail':
-            df = format_adaptation_summary_detail(data)
+    Args:
+        path (Path): The path of the CSV file
+    Returns:
+        A text file object
+    """
+    return open(path, 'w', buffering=8 << 20, newline='', encoding='utf-8')
 
-        else:
-            raise NotImplementedError
 
-    elif product == 'probability':
-        if product_subtype == 'chance':
-            df = format_probability_chance(data)
+def write_frame(df, f):
+    """Writes a formatted DataFrame to a CSV, dropping the valid_id and error columns when they carry no information
 
-        elif product_subtype == 'count':
-            df = format_probability_count(data)
+    Args:
+        df (DataFrame): A pandas formatted DataFrame
+        f (file): A text file opened for writing
+    """
+    keep_valid_id, keep_error = _keep_status_columns(df['valid_id'], df['error'] if 'error' in df else None)
 
-        elif product_subtype == 'count-summary':
-            df = format_probability_count_summary(data)
+    if not keep_valid_id:
+        df = df.drop(columns=['valid_id'])
+    elif df['valid_id'].hasnans:
+        df['valid_id'] = df['valid_id'].fillna(True)
 
-        elif product_subtype == 'cumulative':
-            df = format_probability_cumulative(data)
+    if 'error' in df and not keep_error:
+        df = df.drop(columns=['error'])
 
-        elif product_subtype == 'depth':
-            df = format_probability_depth(data)
-        else:
-            raise NotImplementedError
+    # Write in chunks rather than converting the whole frame to strings first, letting to_csv represent every missing
+    # value
+    df.to_csv(f, index=False, na_rep='<NA>', chunksize=50000)
 
-    elif product == 'environmental':
-        if product_subtype == 'precipitation':
-            df = format_environmental_precipitation(data)
 
-        else:
-            raise NotImplementedError
+def _keep_status_columns(valid_id, error):
+    """Decides whether the valid_id and error columns are written to a CSV. valid_id is only kept when an id is invalid,
+    missing values counting as valid, and error is only kept when there is an error
 
-    elif product == 'historic':
-        if product_subtype == 'event':
-            df = format_historic_event(data)
+    Args:
+        valid_id (Series): The valid_id values
+        error (Series/None): The error values, or None if there is no error column
+    Returns:
+        A tuple of whether to keep the valid_id column and whether to keep the error column
+    """
+    return not valid_id.all(), error is not None and not error.isnull().all()
 
-        elif product_subtype == 'summary':
-            if location_type == 'property':
-                df = format_historic_summary_property(data)
 
-            else:
-                df = format_historic_summary(data)
+def _csv_value(value):
+    """Converts a value for a CSV row, representing missing values the way the DataFrame CSVs do
 
-        elif product_subtype == 'summary_event':
-            if location_type == 'property':
-                df = format_historic_summary_event_property(data)
+    Args:
+        value (object): The value to write
+    Returns:
+        The value, or '<NA>' if it is missing
+    """
+    return '<NA>' if value is None or value != value else value
 
-            else:
-                df = format_historic_summary_event(data)
 
-        else:
-            raise NotImplementedError
+def _csv_int(value):
+    """Converts a number for a CSV row to an integer string, representing missing values the way the DataFrame CSVs do
 
-    elif product == 'location':
-        if product_subtype == 'detail':
-            if location_type == 'property':
-                df = format_location_detail_property(data)
+    Args:
+        value (int/float): The number to write
+    Returns:
+        A string of the integer, or '<NA>' if it is missing
+    """
+    return '<NA>' if value is None or value != value else str(int(value))
 
-            elif location_type == 'neighborhood':
-                df = format_location_detail_neighborhood(data)
 
-            elif location_type == 'city':
-                df = format_location_detail_city(data)
+def write_historic_event(data, f):
+    """Writes the list of data to Historic Event format, one row per object without building a DataFrame
 
-            elif location_type == 'zcta':
-                df = format_location_detail_zcta(data)
+    Args:
+        data (list): A list of FSF object
+        f (file): A text file opened for writing
+    """
+    # Same rules as _keep_status_columns, checked on the objects
+    keep_valid_id = not all(o.valid_id for o in data if o.valid_id is not None)
+    keep_error = any(o.error is not None for o in data)
+
+    def rows():
+        for o in data:
+            properties = o.properties if isinstance(o.properties, dict) else {}
+            latitude, longitude = _geom_center(o.geometry)
+            yield {'eventId': o.eventId, 'valid_id': True if o.valid_id is None else o.valid_id,
+                   'name': _csv_value(o.name), 'month': _csv_int(o.month), 'year': _csv_int(o.year),
+                   'returnPeriod': _csv_int(o.returnPeriod), 'type': _csv_value(o.type),
+                   'propertiesTotal': _csv_int(properties.get('total')),
+                   'propertiesAffected': _csv_int(properties.get('affected')), 'latitude': _csv_value(latitude),
+                   'longitude': _csv_value(longitude), 'error': _csv_value(o.error)}
+
+    header = [column for column in _HISTORIC_EVENT_COLUMNS
+              if (column != 'valid_id' or keep_valid_id) and (column != 'error' or keep_error)]
+    writer = csv.DictWriter(f, header, extrasaction='ignore', lineterminator=os.linesep)
+    writer.writeheader()
+    writer.writerows(rows())
+
+
+def _geom_latlon(geoms):
+    """Gets the latitude and longitude of the center of each geometry in a single pass
 
-            elif location_type == 'tract':
-                df = format_location_detail_tract(data)
+    Args:
+        geoms (array): An array of Geometry objects or shapely points
+    Returns:
+        A tuple of numpy arrays of the latitudes and longitudes, NaN where no center is available
+    """
+    coords = np.fromiter(itertools.chain.from_iterable(map(_geom_center, geoms)), dtype=np.float64,
+                         count=2 * len(geoms)).reshape(-1, 2)
 
-            elif location_type == 'county':
-                df = format_location_detail_county(data)
+    return coords[:, 0], coords[:, 1]
 
-            elif location_type == 'cd':
-                df = format_location_detail_cd(data)
 
-            elif location_type == 'state':
-                df = format_location_detail_state(data)
+def _geom_center(geom):
+    """Gets the latitude and longitude of the center of a geometry
 
-            else:
-                raise NotImplementedError
+    Args:
+        geom (object): A Geometry object or shapely point
+    Returns:
+        A tuple of the latitude and longitude, NaN where no center is available
+    """
+    center = getattr(geom, 'center', geom)
 
-        elif product_subtype == 'summary':
+    if isinstance(center, shapely.geometry.MultiPolygon) and not center.is_empty:
+        center = center.centroid
 
-            if location_type == 'property':
-                df = format_location_summary_property(data)
+    if isinstance(center, shapely.geometry.Point):
+        return center.y, center.x
 
-            else:
-                df = format_location_summary(data)
+    return np.nan, np.nan
 
-        else:
-            raise NotImplementedError
 
-    elif product == 'fema':
-        if product_subtype == 'nfip':
-            df = format_fema_nfip(data)
-        else:
-            raise NotImplementedError
+def _int_str(series):
+    """Converts a numeric series to nullable integer strings
 
-    elif product == 'economic_aal':
+    Args:
+        series (Series): A pandas Series of numbers
+    Returns:
+        A pandas Series of strings
+    """
+    return series.astype('Int64').astype('string')
 
-        if product_subtype == 'summary':
 
-            if location_type == 'property':
-                df = format_aal_summary_property(data)
+def _int_str_columns(df, columns):
+    """Converts numeric columns of a DataFrame to nullable integer strings, casting all of them at once
 
-            else:
-                df = format_aal_summary(data)
+    Args:
+        df (DataFrame): A pandas DataFrame
+        columns (tuple): The names of the numeric columns
+    Returns:
+        A pandas DataFrame
+    """
+    return df.astype(dict.fromkeys(columns, 'Int64')).astype(dict.fromkeys(columns, 'string'))
 
-        else:
-            raise NotImplementedError
 
-    elif product == 'economic_avm':
+def _state_fips_str(series):
+    """Converts state FIPS numbers to zero-padded two digit strings, looking them up in a table of the two digit strings
+    rather than formatting and padding each one
 
-        if product_subtype == 'avm':
+    Args:
+        series (Series): A pandas Series of numbers
+    Returns:
+        A pandas Series of strings
+    """
+    values = series.astype('Int64')
+    codes = values.to_numpy(dtype=np.int64, na_value=0)
 
-            df = format_avm(data)
+    if codes.size and (codes.min() < 0 or codes.max() >= len(_TWO_DIGITS)):
+        return _int_str(values).str.zfill(2)
 
-        elif product_subtype == "provider":
+    fips = pd.Series(_TWO_DIGITS[codes], index=series.index, dtype='string')
+    fips[values.isna().to_numpy()] = pd.NA
+    return fips
 
-            df = format_avm_provider(data)
 
-        else:
-            raise NotImplementedError
+def _expand_dict_column(df, col, keys=None):
+    """Expands a column of dicts into one column per key, replacing the original column
 
-    elif product == 'economic':
+    Args:
+        df (DataFrame): A pandas DataFrame with a unique index
+        col (str): The name of the column of dicts
+        keys (list/None): The keys to expand, missing ones giving missing values, or None to expand every key found
+    Returns:
+        A pandas DataFrame
+    """
+    expanded = pd.DataFrame([value if isinstance(value, dict) else {} for value in df[col]], index=df.index,
+                            columns=keys, copy=False)
+    return df.drop(columns=[col]).join(expanded)
 
-        if product_subtype == 'nfip':
 
-            df = format_economic_nfip_premium(data)
+def _expand_locations(df, columns):
+    """Replaces nested location columns with their FIPS and name columns, assigning the new columns directly
 
-        else:
-            raise NotImplementedError
+    Args:
+        df (DataFrame): A pandas DataFrame
+        columns (dict): The FIPS and name column names for each nested location column
+    Returns:
+        A pandas DataFrame
+    """
+    for column, (fips, name) in columns.items():
+        locations = [value if isinstance(value, dict) else {} for value in df[column].values]
+        df[fips] = [location.get('fsid') for location in locations]
+        df[name] = [location.get('name') for location in locations]
 
-    else:
-        raise NotImplementedError
+    return df.drop(columns=list(columns))
 
-    # Export CSVs
-    if df['valid_id'].all():
-        df = df.drop(columns=['valid_id'])
-    else:
-        df['valid_id'] = df['valid_id'].fillna(True)
 
-    # Export CSVs
-    if 'error' in df and df['error'].isnull().all():
-        df = df.drop(columns=['error'])
+def _has_data(data, attribute):
+    """Checks whether any FSF object has data for an attribute, stopping at the first one that does
+
+    Args:
+        data (list): A list of FSF object
+        attribute (str): The attribute to check
+    Returns:
+        True if any object has a non-empty value for the attribute
+    """
+    return any(getattr(o, attribute) for o in data)
+
+
+def _object_frame(data, columns, explode=None):
+    """Creates a DataFrame from the given attributes of a list of FSF objects, one column per attribute
+
+    Args:
+        data (list): A list of FSF object
+        columns (list): The attributes to extract, at least two
+        explode (list/None): The list attributes to explode into one row per combination of their values, like
+            chaining DataFrame.explode on each of them, before the DataFrame is built. Empty lists give a NaN row
+    Returns:
+        A pandas DataFrame
+    """
+    rows = map(operator.attrgetter(*columns), data)
+
+    if explode:
+        positions = [columns.index(column) for column in explode]
+        rows = _product_rows(rows, positions)
+
+    values = zip(*rows)
+    return pd.DataFrame(dict(zip(columns, values)), columns=columns, copy=False)
 
-    df = df.fillna(pd.NA).astype(str)
-    df.to_csv(output_dir / file_name, index=False)
-    logging.info("CSV generated to '{}'.".format(output_dir / file_name))
 
+def _product_rows(rows, positions):
+    """Yields one row per combination of the values of the list fields at the given positions of each row
 
-def get_geom_center(geom):
+    Args:
+        rows (iterable): The rows, as tuples of field values
+        positions (list): The positions of the list fields
+    Returns:
+        A generator of the rows, as lists of field values
+    """
+    for row in rows:
+        items = [(row[position] or [np.nan]) if isinstance(row[position], list) else [row[position]]
+                 for position in positions]
+
+        for combination in itertools.product(*items):
+            exploded = list(row)
+            for position, value in zip(positions, combination):
+                exploded[position] = value
+            yield exploded
 
-    if hasattr(geom, "center"):
-        if isinstance(geom.center, shapely.geometry.MultiPolygon) and not geom.center.is_empty:
-            return {"latitude": geom.center.centroid.y, "longitude": geom.center.centroid.x}
 
-        elif isinstance(geom.center, shapely.geometry.Point):
-            return {"latitude": geom.center.y, "longitude": geom.center.x}
+def _flatten_record(record, max_level=None, prefix="", level=0):
+    """Flattens the nested dicts of a record into a single dict with dot separated keys, matching the column names
+    produced by pd.json_normalize
 
+    Args:
+        record (dict): The record to flatten
+        max_level (int/None): The max number of levels to flatten, or None to flatten all levels
+        prefix (str): The prefix to add to each key
+        level (int): The current nesting level
+    Returns:
+        A flat dict
+    """
+    flat = {}
+    for key, value in record.items():
+        name = prefix + key
+        if isinstance(value, dict) and (max_level is None or level < max_level):
+            flat.update(_flatten_record(value, max_level, name + ".", level + 1))
         else:
-            return {"latitude": pd.NA, "longitude": pd.NA}
+            flat[name] = value
+
+    return flat
+
+
+def _normalize_objects(data, max_level=None):
+    """Creates a DataFrame from a list of FSF objects, flattening any nested dicts into their own columns
+
+    Args:
+        data (list): A list of FSF object
+        max_level (int/None): The max number of levels to flatten, or None to flatten all levels
+    Returns:
+        A pandas DataFrame
+    """
+    return pd.DataFrame([_flatten_record(vars(o), max_level) for o in data], copy=False)
+
+
+# Missing data columns of the rows for FSF objects without data, built once and copied into each row
+_EMPTY_CHANCE = dict.fromkeys(['year', 'threshold', 'data.low', 'data.mid', 'data.high'], pd.NA)
+_EMPTY_COUNT = dict.fromkeys(['year', 'data.returnPeriod', 'bin', 'count.low', 'count.mid', 'count.high'], pd.NA)
+_EMPTY_COUNT_SUMMARY = dict.fromkeys(['location', 'location_fips', 'location_name', 'subtype', 'year', 'low', 'mid',
+                                      'high'], pd.NA)
+_EMPTY_DEPTH = dict.fromkeys(['year', 'returnPeriod', 'data.low', 'data.mid', 'data.high'], pd.NA)
+
+# Location types of the Probability Count-Summary rows, in the order they are listed
+_COUNT_SUMMARY_LOCATIONS = pd.CategoricalDtype(['state', 'city', 'zcta', 'neighborhood', 'tract', 'county', 'cd'])
+
+# Integer columns of the Location Summary and Fema Nfip formats
+_LOCATION_SUMMARY_PROPERTY_INT_COLS = ('riskDirection', 'environmentalRisk', 'historic', 'adaptation', 'floodFactor')
+_LOCATION_SUMMARY_INT_COLS = ('riskDirection', 'environmentalRisk', 'historic', 'adaptation', 'propertiesTotal',
+                              'propertiesAtRisk')
+_FEMA_INT_COLS = ('claimCount', 'policyCount', 'buildingPaid', 'contentPaid', 'buildingCoverage', 'contentCoverage',
+                  'iccPaid')
+
+# Columns of the Historic Event format, shared by its formatter and its writer
+_HISTORIC_EVENT_COLUMNS = ['eventId', 'valid_id', 'name', 'month', 'year', 'returnPeriod', 'type', 'propertiesTotal',
+                           'propertiesAffected', 'latitude', 'longitude', 'error']
+
+# Zero-padded strings of the two digit numbers, indexed by number
+_TWO_DIGITS = np.array(['{:02d}'.format(number) for number in range(100)], dtype=object)
+
+
+def _empty_row(obj, template):
+    """Creates the row for a FSF object that has no data, keeping its FSID, valid_id, and error
+
+    Args:
+        obj (object): A FSF object
+        template (dict): The data columns of the row, filled with missing values
+    Returns:
+        A dict of the row
+    """
+    return {'fsid': str(obj.fsid), 'valid_id': obj.valid_id, 'error': obj.error, **template}
+
+
+def _records_frame(rows, template):
+    """Creates a DataFrame from the probability rows with a fixed set of columns, rather than inferring them from the
+    keys of every row
+
+    Args:
+        rows (list): A list of the rows
+        template (dict): The data columns of the rows, as in their no-data template
+    Returns:
+        A pandas DataFrame
+    """
+    return pd.DataFrame.from_records(rows, columns=['fsid', 'valid_id', 'error', *template])
+
+
+def _chance_rows(obj):
+    """Flattens each threshold record of a Probability Chance object with its year and FSID
+
+    Args:
+        obj (object): A FSF object
+    Returns:
+        A list of the rows
+    """
+    if obj.chance is None:
+        return [_empty_row(obj, _EMPTY_CHANCE)]
+
+    return [_flatten_record({'fsid': obj.fsid, 'valid_id': obj.valid_id, 'error': obj.error, 'year': year['year'],
+                             **record})
+            for year in obj.chance for record in year['data']]
+
+
+def _count_rows(obj):
+    """Flattens each bin record of a Probability Count object with its year, return period, and FSID
 
-    elif hasattr(geom, "y") and hasattr(geom, "x"):
-        return {"latitude": geom.y, "longitude": geom.x}
+    Args:
+        obj (object): A FSF object
+    Returns:
+        A list of the rows
+    """
+    if obj.count is None:
+        return [_empty_row(obj, _EMPTY_COUNT)]
+
+    return [_flatten_record({'fsid': obj.fsid, 'valid_id': obj.valid_id, 'error': obj.error, 'year': year['year'],
+                             'data.returnPeriod': return_period['returnPeriod'], **record})
+            for year in obj.count for return_period in year['data'] for record in return_period['data']]
 
-    return {"latitude": None, "longitude": None}
+
+def _count_summary_rows(obj):
+    """Flattens each yearly count of each location of a Probability Count-Summary object with its location and FSID
+
+    Args:
+        obj (object): A FSF object
+    Returns:
+        A list of the rows
+    """
+    rows = []
+
+    for location in _COUNT_SUMMARY_LOCATIONS.categories:
+        for loc in getattr(obj, location) or []:
+            for record in loc.get('count') or []:
+                counts = record.get('data') or {}
+                rows.append({'fsid': obj.fsid, 'valid_id': obj.valid_id, 'error': obj.error,
+                             'location': location, 'location_fips': loc.get('fsid'),
+                             'location_name': loc.get('name'), 'subtype': loc.get('subtype'),
+                             'year': record.get('year'), 'low': counts.get('low'), 'mid': counts.get('mid'),
+                             'high': counts.get('high')})
+
+    return rows or [_empty_row(obj, _EMPTY_COUNT_SUMMARY)]
+
+
+def _cumulative_rows(obj):
+    """Flattens each threshold record of a Probability Cumulative object with its year and FSID
+
+    Args:
+        obj (object): A FSF object
+    Returns:
+        A list of the rows
+    """
+    if obj.cumulative is None:
+        return [_empty_row(obj, _EMPTY_CHANCE)]
+
+    return [_flatten_record({'fsid': obj.fsid, 'valid_id': obj.valid_id, 'error': obj.error, 'year': year['year'],
+                             **record})
+            for year in obj.cumulative for record in year['data']]
+
+
+def _depth_rows(obj):
+    """Flattens each return period record of a Probability Depth object with its year and FSID
+
+    Args:
+        obj (object): A FSF object
+    Returns:
+        A list of the rows
+    """
+    if obj.depth is None:
+        return [_empty_row(obj, _EMPTY_DEPTH)]
+
+    return [_flatten_record({'fsid': obj.fsid, 'valid_id': obj.valid_id, 'error': obj.error, 'year': year['year'],
+                             **record})
+            for year in obj.depth for record in year['data']]
 
 
 def format_adaptation_detail(data):
@@ -226,12 +503,19 @@ def format_adaptation_detail(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.json_normalize([vars(o) for o in data]).explode('type').explode('scenario').reset_index(drop=True)
-    df['adaptationId'] = df['adaptationId'].apply(str)
-    df['returnPeriod'] = df['returnPeriod'].astype('Int64').apply(str)
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    if ("serving.property" not in df and "serving" in df and df["serving"].isnull().all()) or \
-            ("serving.property" in df and df["serving.property"].isnull().all()):
+    columns = ['adaptationId', 'valid_id', 'name', 'type', 'scenario', 'conveyance', 'returnPeriod', 'serving_property',
+               'serving_neighborhood', 'serving_zcta', 'serving_tract', 'serving_city', 'serving_county', 'serving_cd',
+               'serving_state', 'latitude', 'longitude', 'error']
+    if not data:
+        return pd.DataFrame(columns=columns)
+
+    df = _object_frame(data, ['adaptationId', 'valid_id', 'name', 'type', 'scenario', 'conveyance', 'returnPeriod',
+                              'serving', 'geometry', 'error'], explode=['type', 'scenario'])
+    df = _expand_dict_column(df, 'serving')
+    df['adaptationId'] = df['adaptationId'].astype(str)
+    df['returnPeriod'] = _int_str(df['returnPeriod'])
+    df['latitude'], df['longitude'] = _geom_latlon(df['geometry'].values)
+    if "property" not in df or df["property"].isnull().all():
         df["serving_property"] = pd.NA
         df["serving_neighborhood"] = pd.NA
         df["serving_zcta"] = pd.NA
@@ -241,20 +525,18 @@ def format_adaptation_detail(data):
         df["serving_cd"] = pd.NA
         df["serving_state"] = pd.NA
     else:
-        df = df.rename(columns={"serving.property": "serving_property",
-                                "serving.neighborhood": "serving_neighborhood",
-                                "serving.zcta": "serving_zcta",
-                                "serving.tract": "serving_tract",
-                                "serving.city": "serving_city",
-                                "serving.county": "serving_county",
-                                "serving.cd": "serving_cd",
-                                "serving.state": "serving_state"})
-
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
-
-    return df[['adaptationId', 'valid_id', 'name', 'type', 'scenario', 'conveyance', 'returnPeriod', 'serving_property',
-               'serving_neighborhood', 'serving_zcta', 'serving_tract', 'serving_city', 'serving_county', 'serving_cd',
-               'serving_state', 'latitude', 'longitude', 'error']]
+        df = df.rename(columns={"property": "serving_property",
+                                "neighborhood": "serving_neighborhood",
+                                "zcta": "serving_zcta",
+                                "tract": "serving_tract",
+                                "city": "serving_city",
+                                "county": "serving_county",
+                                "cd": "serving_cd",
+                                "state": "serving_state"}, copy=False)
+
+    df = df.drop(columns=['geometry'])
+
+    return df[columns]
 
 
 def format_adaptation_summary(data):
@@ -265,14 +547,18 @@ def format_adaptation_summary(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.json_normalize([vars(o) for o in data]).explode('adaptation').reset_index(drop=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['adaptation'] = df['adaptation'].astype('Int64').apply(str)
+    columns = ['fsid', 'valid_id', 'adaptation', 'properties', 'error']
+    if not data:
+        return pd.DataFrame(columns=columns)
+
+    df = _normalize_objects(data).explode('adaptation').reset_index(drop=True)
+    df['fsid'] = df['fsid'].astype(str)
+    df['adaptation'] = _int_str(df['adaptation'])
 
     if "properties" not in df or df.properties.isnull().all():
         df["properties"] = pd.NA
 
-    return df[['fsid', 'valid_id', 'adaptation', 'properties', 'error']]
+    return df[columns]
 
 
 def format_adaptation_summary_detail(data):
@@ -288,8 +574,8 @@ def format_adaptation_summary_detail(data):
     detail = format_adaptation_detail(data[1])
 
     return pd.merge(summary, detail, left_on=['adaptation', 'valid_id'],
-                    right_on=['adaptationId', 'valid_id'], how='left').drop('adaptationId', axis=1)\
-        .rename(columns={"error_x": "error"}).drop('error_y', axis=1)
+                    right_on=['adaptationId', 'valid_id'], how='left', copy=False)\
+        .drop(columns=['adaptationId', 'error_y']).rename(columns={"error_x": "error"}, copy=False)
 
 
 def format_probability_chance(data):
@@ -301,38 +587,12 @@ def format_probability_chance(data):
         A pandas formatted DataFrame
     """
 
-    depth_list = list()
-
-    # Loop through data
-    for d in data:
-
-        try:
-            # Normalize data to get df
-            row_df = pd.json_normalize(d.chance, record_path='data', meta=['year'])
-
-            # Add FSID to row
-            row_df['fsid'] = d.fsid
-            row_df['valid_id'] = d.valid_id
-            row_df['error'] = d.error
-
-            # Add rows to df - return periods matched to depths across scenarios
-            depth_list.append(row_df)
-
-        except TypeError:
-            row_df = pd.DataFrame([[str(d.fsid), d.valid_id, d.error]], columns=['fsid', 'valid_id', 'error'])
-            row_df['year'] = pd.NA
-            row_df['threshold'] = pd.NA
-            row_df['data.low'] = pd.NA
-            row_df['data.mid'] = pd.NA
-            row_df['data.high'] = pd.NA
-            depth_list.append(row_df)
-
     # Get into df
-    df = pd.concat(depth_list, axis=0).reset_index(drop=True)
-    df.rename(columns={'data.low': 'low', 'data.mid': 'mid', 'data.high': 'high'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['year'] = df['year'].astype('Int64').apply(str)
-    df['threshold'] = df['threshold'].astype('Int64').apply(str)
+    df = _records_frame([row for obj in data for row in _chance_rows(obj)], _EMPTY_CHANCE)
+    df = df.rename(columns={'data.low': 'low', 'data.mid': 'mid', 'data.high': 'high'}, copy=False)
+    df['fsid'] = df['fsid'].astype(str)
+    df['year'] = _int_str(df['year'])
+    df['threshold'] = _int_str(df['threshold'])
     if df['low'] is None:
         df['low'] = df['low'].round(3)
     if df['mid'] is None:
@@ -352,44 +612,17 @@ def format_probability_count(data):
         A pandas formatted DataFrame
     """
 
-    depth_list = list()
-
-    # Loop through data
-    for d in data:
-
-        try:
-            # Normalize data to get df
-            row_df = pd.json_normalize(d.count, record_path=['data', 'data'], meta=['year', ['data', 'returnPeriod']])
-
-            # Add FSID to row
-            row_df['fsid'] = d.fsid
-            row_df['valid_id'] = d.valid_id
-            row_df['error'] = d.error
-
-            # Add rows to df - return periods matched to depths across scenarios
-            depth_list.append(row_df)
-
-        except TypeError:
-            row_df = pd.DataFrame([[str(d.fsid), d.valid_id, d.error]], columns=['fsid', 'valid_id', 'error'])
-            row_df['year'] = pd.NA
-            row_df['data.returnPeriod'] = pd.NA
-            row_df['bin'] = pd.NA
-            row_df['count.low'] = pd.NA
-            row_df['count.mid'] = pd.NA
-            row_df['count.high'] = pd.NA
-            depth_list.append(row_df)
-
     # Get into df
-    df = pd.concat(depth_list, axis=0).reset_index(drop=True)
-    df.rename(columns={'count.low': 'low', 'count.mid': 'mid', 'count.high': 'high',
-                       'data.returnPeriod': 'returnPeriod'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['year'] = df['year'].astype('Int64').apply(str)
-    df['returnPeriod'] = df['returnPeriod'].astype('Int64').apply(str)
-    df['bin'] = df['bin'].astype('Int64').apply(str)
-    df['low'] = df['low'].astype('Int64').apply(str)
-    df['mid'] = df['mid'].astype('Int64').apply(str)
-    df['high'] = df['high'].astype('Int64').apply(str)
+    df = _records_frame([row for obj in data for row in _count_rows(obj)], _EMPTY_COUNT)
+    df = df.rename(columns={'count.low': 'low', 'count.mid': 'mid', 'count.high': 'high',
+                            'data.returnPeriod': 'returnPeriod'}, copy=False)
+    df['fsid'] = df['fsid'].astype(str)
+    df['year'] = _int_str(df['year'])
+    df['returnPeriod'] = _int_str(df['returnPeriod'])
+    df['bin'] = _int_str(df['bin'])
+    df['low'] = _int_str(df['low'])
+    df['mid'] = _int_str(df['mid'])
+    df['high'] = _int_str(df['high'])
 
     return df[['fsid', 'valid_id', 'year', 'returnPeriod', 'bin', 'low', 'mid', 'high', 'error']]
 
@@ -402,60 +635,15 @@ def format_probability_count_summary(data):
     Returns:
         A pandas formatted DataFrame
     """
-    listed_data = [{'fsid': attr.fsid, 'valid_id': attr.valid_id, 'error': attr.error,
-                    'location': [{'location': 'state', 'data': attr.state},
-                                 {'location': 'city', 'data': attr.city},
-                                 {'location': 'zcta', 'data': attr.zcta},
-                                 {'location': 'neighborhood', 'data': attr.neighborhood},
-                                 {'location': 'tract', 'data': attr.tract},
-                                 {'location': 'county', 'data': attr.county},
-                                 {'location': 'cd', 'data': attr.cd}]} for attr in data]
-
-    depth_list = list()
-
-    # Loop through data
-    for d in listed_data:
-
-        try:
-            # Normalize data to get df
-            row_df = pd.json_normalize(d["location"], ['data', 'count'],
-                                       ['location', ['location', 'fsid'], ['location', 'name'],
-                                        ['location', 'subtype']], errors='ignore')
-
-            # Add FSID to row
-            row_df['fsid'] = d["fsid"]
-            row_df['valid_id'] = d["valid_id"]
-            row_df['error'] = d["error"]
-
-            depth_list.append(row_df)
-
-        except TypeError:
-            row_df = pd.DataFrame([[str(d["fsid"]), d["valid_id"], d["error"]]], columns=['fsid', 'valid_id', 'error'])
-            row_df['location'] = pd.NA
-            row_df['location.fsid'] = pd.NA
-            row_df['location.name'] = pd.NA
-            row_df['location.subtype'] = pd.NA
-            row_df['year'] = pd.NA
-            row_df['data.low'] = pd.NA
-            row_df['data.mid'] = pd.NA
-            row_df['data.high'] = pd.NA
-
-            depth_list.append(row_df)
-
     # Get into df
-    df = pd.concat(depth_list, axis=0).reset_index(drop=True)
-    df.rename(
-        columns={'location.fsid': 'location_fips', 'location.name': 'location_name', 'location.subtype': 'subtype',
-                 'data.low': 'low', 'data.mid': 'mid', 'data.high': 'high'},
-        inplace=True)
-    if 'subtype' not in df:
-        df['subtype'] = pd.NA
-    df['fsid'] = df['fsid'].apply(str)
-    df['location_fips'] = df['location_fips'].astype('Int64').apply(str)
-    df['year'] = df['year'].astype('Int64').apply(str)
-    df['low'] = df['low'].astype('Int64').apply(str)
-    df['mid'] = df['mid'].astype('Int64').apply(str)
-    df['high'] = df['high'].astype('Int64').apply(str)
+    df = _records_frame([row for obj in data for row in _count_summary_rows(obj)], _EMPTY_COUNT_SUMMARY)
+    df['fsid'] = df['fsid'].astype(str)
+    df['location'] = df['location'].astype(_COUNT_SUMMARY_LOCATIONS)
+    df['location_fips'] = _int_str(df['location_fips'])
+    df['year'] = _int_str(df['year'])
+    df['low'] = _int_str(df['low'])
+    df['mid'] = _int_str(df['mid'])
+    df['high'] = _int_str(df['high'])
 
     return df[['fsid', 'valid_id', 'location', 'location_fips',
                'location_name', 'subtype', 'year', 'low', 'mid', 'high', 'error']]
@@ -470,38 +658,12 @@ def format_probability_cumulative(data):
         A pandas formatted DataFrame
     """
 
-    depth_list = list()
-
-    # Loop through data
-    for d in data:
-
-        try:
-            # Normalize data to get df
-            row_df = pd.json_normalize(d.cumulative, record_path='data', meta='year')
-
-            # Add FSID to row
-            row_df['fsid'] = d.fsid
-            row_df['valid_id'] = d.valid_id
-            row_df['error'] = d.error
-
-            # Add rows to df - return periods matched to depths across scenarios
-            depth_list.append(row_df)
-
-        except TypeError:
-            row_df = pd.DataFrame([[str(d.fsid), d.valid_id, d.error]], columns=['fsid', 'valid_id', 'error'])
-            row_df['year'] = pd.NA
-            row_df['threshold'] = pd.NA
-            row_df['data.low'] = pd.NA
-            row_df['data.mid'] = pd.NA
-            row_df['data.high'] = pd.NA
-            depth_list.append(row_df)
-
     # Get into df
-    df = pd.concat(depth_list, axis=0).reset_index(drop=True)
-    df.rename(columns={'data.low': 'low', 'data.mid': 'mid', 'data.high': 'high'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['year'] = df['year'].astype('Int64').apply(str)
-    df['threshold'] = df['threshold'].astype('Int64').apply(str)
+    df = _records_frame([row for obj in data for row in _cumulative_rows(obj)], _EMPTY_CHANCE)
+    df = df.rename(columns={'data.low': 'low', 'data.mid': 'mid', 'data.high': 'high'}, copy=False)
+    df['fsid'] = df['fsid'].astype(str)
+    df['year'] = _int_str(df['year'])
+    df['threshold'] = _int_str(df['threshold'])
     if df['low'] is None:
         df['low'] = df['low'].round(3)
     if df['mid'] is None:
@@ -521,41 +683,15 @@ def format_probability_depth(data):
         A pandas formatted DataFrame
     """
 
-    depth_list = list()
-
-    # Loop through data
-    for d in data:
-
-        try:
-            # Normalize data to get df
-            row_df = pd.json_normalize(d.depth, record_path='data', meta=['year'])
-
-            # Add FSID to row
-            row_df['fsid'] = d.fsid
-            row_df['valid_id'] = d.valid_id
-            row_df['error'] = d.error
-
-            # Add rows to df - return periods matched to depths across scenarios
-            depth_list.append(row_df)
-
-        except TypeError:
-            row_df = pd.DataFrame([[str(d.fsid), d.valid_id, d.error]], columns=['fsid', 'valid_id', 'error'])
-            row_df['year'] = pd.NA
-            row_df['returnPeriod'] = pd.NA
-            row_df['data.low'] = pd.NA
-            row_df['data.mid'] = pd.NA
-            row_df['data.high'] = pd.NA
-            depth_list.append(row_df)
-
     # Get into df
-    df = pd.concat(depth_list, axis=0).reset_index(drop=True)
-    df.rename(columns={'data.low': 'low', 'data.mid': 'mid', 'data.high': 'high'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['year'] = df['year'].astype('Int64').apply(str)
-    df['returnPeriod'] = df['returnPeriod'].astype('Int64').apply(str)
-    df['low'] = df['low'].astype('Int64').apply(str)
-    df['mid'] = df['mid'].astype('Int64').apply(str)
-    df['high'] = df['high'].astype('Int64').apply(str)
+    df = _records_frame([row for obj in data for row in _depth_rows(obj)], _EMPTY_DEPTH)
+    df = df.rename(columns={'data.low': 'low', 'data.mid': 'mid', 'data.high': 'high'}, copy=False)
+    df['fsid'] = df['fsid'].astype(str)
+    df['year'] = _int_str(df['year'])
+    df['returnPeriod'] = _int_str(df['returnPeriod'])
+    df['low'] = _int_str(df['low'])
+    df['mid'] = _int_str(df['mid'])
+    df['high'] = _int_str(df['high'])
 
     return df[['fsid', 'valid_id', 'year', 'returnPeriod', 'low', 'mid', 'high', 'error']]
 
@@ -569,18 +705,18 @@ def format_environmental_precipitation(data):
         A pandas formatted DataFrame
     """
     #
-    df = pd.DataFrame([vars(o) for o in data]).explode('projected').reset_index(drop=True)
-    if not df['projected'].isna().values.all():
-        df = pd.concat([df.drop(['projected'], axis=1), df['projected'].apply(pd.Series)], axis=1)
-        df = pd.concat([df.drop(['data'], axis=1), df['data'].apply(pd.Series)], axis=1)
-        df['fsid'] = df['fsid'].apply(str)
-        df['year'] = df['year'].astype('Int64').apply(str)
+    df = _object_frame(data, ['fsid', 'valid_id', 'projected', 'error']).explode('projected').reset_index(drop=True)
+    if _has_data(data, 'projected'):
+        df = _expand_dict_column(df, 'projected')
+        df = _expand_dict_column(df, 'data')
+        df['fsid'] = df['fsid'].astype(str)
+        df['year'] = _int_str(df['year'])
         df['low'] = df['low'].round(3)
         df['mid'] = df['mid'].round(3)
         df['high'] = df['high'].round(3)
     else:
-        df['fsid'] = df['fsid'].apply(str)
-        df.drop(['projected'], axis=1, inplace=True)
+        df['fsid'] = df['fsid'].astype(str)
+        df = df.drop(columns=['projected'])
         df['year'] = pd.NA
         df['low'] = pd.NA
         df['mid'] = pd.NA
@@ -598,26 +734,26 @@ def format_historic_event(data):
         A pandas formatted DataFrame
     """
 
-    df = pd.DataFrame([vars(o) for o in data])
-    if not df['properties'].isna().values.all():
-        df = pd.concat([df.drop(['properties'], axis=1), df['properties'].apply(pd.Series)], axis=1)
-        df.rename(columns={'total': 'propertiesTotal', 'affected': 'propertiesAffected'}, inplace=True)
+    df = _object_frame(data, ['eventId', 'valid_id', 'name', 'month', 'year', 'returnPeriod', 'type', 'properties',
+                              'geometry', 'error'])
+    if _has_data(data, 'properties'):
+        df = _expand_dict_column(df, 'properties', keys=['total', 'affected'])
+        df = df.rename(columns={'total': 'propertiesTotal', 'affected': 'propertiesAffected'}, copy=False)
     else:
-        df.drop(['properties'], axis=1, inplace=True)
+        df = df.drop(columns=['properties'])
         df['propertiesTotal'] = pd.NA
         df['propertiesAffected'] = pd.NA
 
-    df['eventId'] = df['eventId'].apply(str)
-    df['month'] = df['month'].astype('Int64').apply(str)
-    df['year'] = df['year'].astype('Int64').apply(str)
-    df['returnPeriod'] = df['returnPeriod'].astype('Int64').apply(str)
-    df['propertiesTotal'] = df['propertiesTotal'].astype('Int64').apply(str)
-    df['propertiesAffected'] = df['propertiesAffected'].astype('Int64').apply(str)
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
+    df['eventId'] = df['eventId'].astype(str)
+    df['month'] = _int_str(df['month'])
+    df['year'] = _int_str(df['year'])
+    df['returnPeriod'] = _int_str(df['returnPeriod'])
+    df['propertiesTotal'] = _int_str(df['propertiesTotal'])
+    df['propertiesAffected'] = _int_str(df['propertiesAffected'])
+    df['latitude'], df['longitude'] = _geom_latlon(df['geometry'].values)
+    df = df.drop(columns=['geometry'])
 
-    return df[['eventId', 'valid_id', 'name', 'month', 'year', 'returnPeriod', 'type', 'propertiesTotal',
-               'propertiesAffected', 'latitude', 'longitude', 'error']]
+    return df[_HISTORIC_EVENT_COLUMNS]
 
 
 def format_historic_summary_property(data):
@@ -628,19 +764,19 @@ def format_historic_summary_property(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data]).explode('historic').reset_index(drop=True)
-    if not df['historic'].isna().values.all():
-        df = pd.concat([df.drop(['historic'], axis=1), df['historic'].apply(pd.Series)], axis=1)
+    df = _object_frame(data, ['fsid', 'valid_id', 'historic', 'error']).explode('historic').reset_index(drop=True)
+    if _has_data(data, 'historic'):
+        df = _expand_dict_column(df, 'historic')
     else:
-        df.drop(['historic'], axis=1, inplace=True)
+        df = df.drop(columns=['historic'])
         df['eventId'] = pd.NA
         df['name'] = pd.NA
         df['type'] = pd.NA
         df['depth'] = pd.NA
 
-    df['fsid'] = df['fsid'].apply(str)
-    df['eventId'] = df['eventId'].astype('Int64').apply(str)
-    df['depth'] = df['depth'].astype('Int64').apply(str)
+    df['fsid'] = df['fsid'].astype(str)
+    df['eventId'] = _int_str(df['eventId'])
+    df['depth'] = _int_str(df['depth'])
 
     return df[['fsid', 'valid_id', 'eventId', 'name', 'type', 'depth', 'error']]
 
@@ -653,27 +789,31 @@ def format_historic_summary(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.json_normalize([vars(o) for o in data]).explode('historic').reset_index(drop=True)
-    if not df['historic'].isna().values.all():
-        df = pd.concat([df.drop(['historic'], axis=1), df['historic'].apply(pd.Series)], axis=1)
+    columns = ['fsid', 'valid_id', 'eventId', 'name', 'type', 'bin', 'count', 'error']
+    if not data:
+        return pd.DataFrame(columns=columns)
+
+    df = _normalize_objects(data).explode('historic').reset_index(drop=True)
+    if _has_data(data, 'historic'):
+        df = _expand_dict_column(df, 'historic')
         df = df.explode('data').reset_index(drop=True)
-        df = pd.concat([df.drop(['data'], axis=1), df['data'].apply(pd.Series)], axis=1)
+        df = _expand_dict_column(df, 'data')
     else:
-        df['fsid'] = df['fsid'].apply(str)
-        df.drop(['historic'], axis=1, inplace=True)
+        df['fsid'] = df['fsid'].astype(str)
+        df = df.drop(columns=['historic'])
         df['eventId'] = pd.NA
         df['name'] = pd.NA
         df['type'] = pd.NA
         df['bin'] = pd.NA
         df['count'] = pd.NA
 
-    df['fsid'] = df['fsid'].apply(str)
-    df['eventId'] = df['eventId'].apply(str)
-    df['type'] = df['type'].apply(str)
-    df['bin'] = df['bin'].astype('Int64').apply(str)
-    df['count'] = df['count'].astype('Int64').apply(str)
+    df['fsid'] = df['fsid'].astype(str)
+    df['eventId'] = df['eventId'].astype(str)
+    df['type'] = df['type'].astype(str)
+    df['bin'] = _int_str(df['bin'])
+    df['count'] = _int_str(df['count'])
 
-    return df[['fsid', 'valid_id', 'eventId', 'name', 'type', 'bin', 'count', 'error']]
+    return df[columns]
 
 
 def format_historic_summary_event_property(data):
@@ -688,8 +828,8 @@ def format_historic_summary_event_property(data):
     summary = format_historic_summary_property(data[0])
     event = format_historic_event(data[1])
 
-    return pd.merge(summary, event, on=['eventId', 'valid_id', 'name', 'type'], how='left')\
-        .rename(columns={"error_x": "error"}).drop(['error_y'], axis=1)
+    return pd.merge(summary, event, on=['eventId', 'valid_id', 'name', 'type'], how='left', copy=False)\
+        .drop(columns=['error_y']).rename(columns={"error_x": "error"}, copy=False)
 
 
 def format_historic_summary_event(data):
@@ -704,8 +844,8 @@ def format_historic_summary_event(data):
     summary = format_historic_summary(data[0])
     event = format_historic_event(data[1])
 
-    return pd.merge(summary, event, on=['eventId', 'valid_id', 'name', 'type'], how='left')\
-        .rename(columns={"error_x": "error"}).drop(['error_y'], axis=1)
+    return pd.merge(summary, event, on=['eventId', 'valid_id', 'name', 'type'], how='left', copy=False)\
+        .drop(columns=['error_y']).rename(columns={"error_x": "error"}, copy=False)
 
 
 def format_location_detail_property(data):
@@ -717,84 +857,38 @@ def format_location_detail_property(data):
         A pandas formatted DataFrame
     """
 
-    df = pd.DataFrame([vars(o) for o in data]).explode('neighborhood').reset_index(drop=True)
-    df.rename(columns={'fsid': 'fsid_placeholder'}, inplace=True)
+    df = _object_frame(data, ['fsid', 'valid_id', 'streetNumber', 'route', 'city', 'zipCode', 'neighborhood', 'tract',
+                              'county', 'cd', 'state', 'footprintId', 'elevation', 'fema', 'floorElevation',
+                              'building', 'floodType', 'residential', 'geometry', 'error'], explode=['neighborhood'])
+    df = _expand_locations(df, {col: (col + '_fips', col + '_name')
+                                for col in ['city', 'neighborhood', 'tract', 'county', 'cd', 'state']})
 
-    if not df['city'].isna().values.all():
-        df = pd.concat([df.drop(['city'], axis=1), df['city'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'city_fips', 'name': 'city_name'}, inplace=True)
+    if _has_data(data, 'building'):
+        df = _expand_dict_column(df, 'building')
     else:
-        df.drop(['city'], axis=1, inplace=True)
-        df['city_fips'] = pd.NA
-        df['city_name'] = pd.NA
-
-    if not df['neighborhood'].isna().values.all():
-        df = pd.concat([df.drop(['neighborhood'], axis=1), df['neighborhood'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'neighborhood_fips', 'name': 'neighborhood_name'}, inplace=True)
-    else:
-        df.drop(['neighborhood'], axis=1, inplace=True)
-        df['neighborhood_fips'] = pd.NA
-        df['neighborhood_name'] = pd.NA
-
-    if not df['tract'].isna().values.all():
-        df = pd.concat([df.drop(['tract'], axis=1), df['tract'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'tract_fips', 'name': 'tract_name'}, inplace=True)
-    else:
-        df.drop(['tract'], axis=1, inplace=True)
-        df['tract_fips'] = pd.NA
-        df['tract_name'] = pd.NA
-
-    if not df['county'].isna().values.all():
-        df = pd.concat([df.drop(['county'], axis=1), df['county'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'county_fips', 'name': 'county_name'}, inplace=True)
-    else:
-        df.drop(['county'], axis=1, inplace=True)
-        df['county_fips'] = pd.NA
-        df['county_name'] = pd.NA
-
-    if not df['cd'].isna().values.all():
-        df = pd.concat([df.drop(['cd'], axis=1), df['cd'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'cd_fips', 'name': 'cd_name'}, inplace=True)
-    else:
-        df.drop(['cd'], axis=1, inplace=True)
-        df['cd_fips'] = pd.NA
-        df['cd_name'] = pd.NA
-
-    if not df['state'].isna().values.all():
-        df = pd.concat([df.drop(['state'], axis=1), df['state'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'state_fips', 'name': 'state_name'}, inplace=True)
-    else:
-        df.drop(['state'], axis=1, inplace=True)
-        df['state_fips'] = pd.NA
-        df['state_name'] = pd.NA
-
-    if not df['building'].isna().values.all():
-        df = pd.concat([df.drop(['building'], axis=1), df['building'].apply(pd.Series)], axis=1)
-    else:
-        df.drop(['building'], axis=1, inplace=True)
+        df = df.drop(columns=['building'])
         df['basement'] = pd.NA
         df['units'] = pd.NA
         df['stories'] = pd.NA
 
-    df.rename(columns={'fsid_placeholder': 'fsid'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['city_fips'] = df['city_fips'].astype('Int64').apply(str)
-    df['neighborhood_fips'] = df['neighborhood_fips'].astype('Int64').apply(str)
-    df['tract_fips'] = df['tract_fips'].astype('Int64').apply(str)
-    df['county_fips'] = df['county_fips'].astype('Int64').apply(str)
-    df['cd_fips'] = df['cd_fips'].astype('Int64').apply(str)
-    df['state_fips'] = df['state_fips'].astype('Int64').apply(str).apply(lambda x: x.zfill(2))
-    df['footprintId'] = df['footprintId'].astype('Int64').apply(str)
-    df['elevation'] = df['elevation'].apply(str)
-    df['fema'] = df['fema'].apply(str)
-    df['floorElevation'] = df['floorElevation'].apply(str)
-    df['floodType'] = df['floodType'].apply(str)
-    df['residential'] = df['residential'].apply(str)
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df['basement'] = df['basement'].apply(str)
-    df['units'] = df['units'].apply(str)
-    df['stories'] = df['stories'].apply(str)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
+    df['fsid'] = df['fsid'].astype(str)
+    df['city_fips'] = _int_str(df['city_fips'])
+    df['neighborhood_fips'] = _int_str(df['neighborhood_fips'])
+    df['tract_fips'] = _int_str(df['tract_fips'])
+    df['county_fips'] = _int_str(df['county_fips'])
+    df['cd_fips'] = _int_str(df['cd_fips'])
+    df['state_fips'] = _state_fips_str(df['state_fips'])
+    df['footprintId'] = _int_str(df['footprintId'])
+    df['elevation'] = df['elevation'].astype(str)
+    df['fema'] = df['fema'].astype(str)
+    df['floorElevation'] = df['floorElevation'].astype(str)
+    df['floodType'] = df['floodType'].astype(str)
+    df['residential'] = df['residential'].astype(str)
+    df['latitude'], df['longitude'] = _geom_latlon(df['geometry'].values)
+    df['basement'] = df['basement'].astype(str)
+    df['units'] = df['units'].astype(str)
+    df['stories'] = df['stories'].astype(str)
+    df = df.drop(columns=['geometry'])
 
     return df[['fsid', 'valid_id', 'streetNumber', 'route', 'city_fips', 'city_name', 'zipCode',
                'neighborhood_fips', 'neighborhood_name', 'tract_fips', 'county_fips', 'county_name', 'cd_fips',
@@ -802,106 +896,77 @@ def format_location_detail_property(data):
                'units', 'stories', 'floodType', 'residential', 'latitude', 'longitude', 'error']]
 
 
-def format_location_detail_neighborhood(data):
-    """Reformat the list of data to Location Detail format for neighborhood
+def _format_location_detail(data, schema):
+    """Reformat the list of data to a Location Detail format described by a schema
 
     Args:
         data (list): A list of FSF object
+        schema (dict): The list columns to explode, the FIPS and name columns of each nested location, and the output
+            columns of the format
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data]).explode('city').explode('county').reset_index(drop=True)
-    df.rename(columns={'fsid': 'fsid_placeholder', 'name': 'name_placeholder'}, inplace=True)
+    locations = schema['locations']
+    fips_columns = [fips for fips, _ in locations.values()]
+    derived = {column for columns in locations.values() for column in columns} | {'latitude', 'longitude'}
+    attributes = [column for column in schema['output'] if column not in derived] + list(locations) + ['geometry']
 
-    if not df['city'].isna().values.all():
-        df = pd.concat([df.drop(['city'], axis=1), df['city'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'city_fips', 'name': 'city_name'}, inplace=True)
-    else:
-        df.drop(['city'], axis=1, inplace=True)
-        df['city_fips'] = pd.NA
-        df['city_name'] = pd.NA
+    df = _object_frame(data, attributes, explode=schema['explode'])
+    df = _expand_locations(df, locations)
 
-    if not df['county'].isna().values.all():
-        df = pd.concat([df.drop(['county'], axis=1), df['county'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'county_fips', 'name': 'county_name'}, inplace=True)
-    else:
-        df.drop(['county'], axis=1, inplace=True)
-        df['county_fips'] = pd.NA
-        df['county_name'] = pd.NA
+    df['fsid'] = df['fsid'].astype(str)
+    df = _int_str_columns(df, [fips for fips in fips_columns if fips != 'state_fips'])
+    if 'state_fips' in df:
+        df['state_fips'] = _state_fips_str(df['state_fips'])
+    df['latitude'], df['longitude'] = _geom_latlon(df['geometry'].values)
+    df = df.drop(columns=['geometry'])
+    return df[schema['output']]
 
-    if not df['state'].isna().values.all():
-        df = pd.concat([df.drop(['state'], axis=1), df['state'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'state_fips', 'name': 'state_name'}, inplace=True)
-    else:
-        df.drop(['state'], axis=1, inplace=True)
-        df['state_fips'] = pd.NA
-        df['state_name'] = pd.NA
 
-    df.rename(columns={'fsid_placeholder': 'fsid', 'name_placeholder': 'name'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['city_fips'] = df['city_fips'].astype('Int64').apply(str)
-    df['county_fips'] = df['county_fips'].astype('Int64').apply(str)
-    df['state_fips'] = df['state_fips'].astype('Int64').apply(str).apply(lambda x: x.zfill(2))
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
-    return df[['fsid', 'valid_id', 'name', 'city_fips', 'city_name', 'county_fips', 'county_name', 'subtype',
-               'state_fips', 'state_name', 'latitude', 'longitude', 'error']]
+_NEIGHBORHOOD_SCHEMA = dict(
+    explode=['city', 'county'],
+    locations={'city': ('city_fips', 'city_name'), 'county': ('county_fips', 'county_name'),
+               'state': ('state_fips', 'state_name')},
+    output=['fsid', 'valid_id', 'name', 'city_fips', 'city_name', 'county_fips', 'county_name', 'subtype', 'state_fips',
+            'state_name', 'latitude', 'longitude', 'error'])
 
 
-def format_location_detail_city(data):
-    """Reformat the list of data to Location Detail format for city
+def format_location_detail_neighborhood(data):
+    """Reformat the list of data to Location Detail format for neighborhood
 
     Args:
         data (list): A list of FSF object
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data]).explode('zcta').explode('county') \
-        .explode('neighborhood').reset_index(drop=True)
-    df.rename(columns={'fsid': 'fsid_placeholder', 'name': 'name_placeholder'}, inplace=True)
+    return _format_location_detail(data, _NEIGHBORHOOD_SCHEMA)
 
-    if not df['zcta'].isna().values.all():
-        df = pd.concat([df.drop(['zcta'], axis=1), df['zcta'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'zipCode', 'name': 'zcta_name'}, inplace=True)
-    else:
-        df.drop(['zcta'], axis=1, inplace=True)
-        df['zipCode'] = pd.NA
-        df['zcta_name'] = pd.NA
 
-    if not df['county'].isna().values.all():
-        df = pd.concat([df.drop(['county'], axis=1), df['county'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'county_fips', 'name': 'county_name'}, inplace=True)
-    else:
-        df.drop(['county'], axis=1, inplace=True)
-        df['county_fips'] = pd.NA
-        df['county_name'] = pd.NA
+_CITY_SCHEMA = dict(
+    explode=['zcta', 'county', 'neighborhood'],
+    locations={'zcta': ('zipCode', 'zcta_name'), 'county': ('county_fips', 'county_name'),
+               'neighborhood': ('neighborhood_fips', 'neighborhood_name'), 'state': ('state_fips', 'state_name')},
+    output=['fsid', 'valid_id', 'name', 'lsad', 'zipCode', 'neighborhood_fips', 'neighborhood_name', 'county_fips',
+            'county_name', 'state_fips', 'state_name', 'latitude', 'longitude', 'error'])
 
-    if not df['neighborhood'].isna().values.all():
-        df = pd.concat([df.drop(['neighborhood'], axis=1), df['neighborhood'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'neighborhood_fips', 'name': 'neighborhood_name'}, inplace=True)
-    else:
-        df.drop(['neighborhood'], axis=1, inplace=True)
-        df['neighborhood_fips'] = pd.NA
-        df['neighborhood_name'] = pd.NA
 
-    if not df['state'].isna().values.all():
-        df = pd.concat([df.drop(['state'], axis=1), df['state'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'state_fips', 'name': 'state_name'}, inplace=True)
-    else:
-        df.drop(['state'], axis=1, inplace=True)
-        df['state_fips'] = pd.NA
-        df['state_name'] = pd.NA
-
-    df.rename(columns={'fsid_placeholder': 'fsid', 'name_placeholder': 'name'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['zipCode'] = df['zipCode'].astype('Int64').apply(str)
-    df['county_fips'] = df['county_fips'].astype('Int64').apply(str)
-    df['neighborhood_fips'] = df['neighborhood_fips'].astype('Int64').apply(str)
-    df['state_fips'] = df['state_fips'].astype('Int64').apply(str).apply(lambda x: x.zfill(2))
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
-    return df[['fsid', 'valid_id', 'name', 'lsad', 'zipCode', 'neighborhood_fips', 'neighborhood_name',
-               'county_fips', 'county_name', 'state_fips', 'state_name', 'latitude', 'longitude', 'error']]
+def format_location_detail_city(data):
+    """Reformat the list of data to Location Detail format for city
+
+    Args:
+        data (list): A list of FSF object
+    Returns:
+        A pandas formatted DataFrame
+    """
+    return _format_location_detail(data, _CITY_SCHEMA)
+
+
+_ZCTA_SCHEMA = dict(
+    explode=['city', 'county'],
+    locations={'city': ('city_fips', 'city_name'), 'county': ('county_fips', 'county_name'),
+               'state': ('state_fips', 'state_name')},
+    output=['fsid', 'valid_id', 'name', 'city_fips', 'city_name', 'county_fips', 'county_name', 'state_fips',
+            'state_name', 'latitude', 'longitude', 'error'])
 
 
 def format_location_detail_zcta(data):
@@ -912,42 +977,14 @@ def format_location_detail_zcta(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data]).explode('city').explode('county')
-    df.rename(columns={'fsid': 'fsid_placeholder', 'name': 'name_placeholder'}, inplace=True)
-
-    if not df['city'].isna().values.all():
-        df = pd.concat([df.drop(['city'], axis=1), df['city'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'city_fips', 'name': 'city_name'}, inplace=True)
-    else:
-        df.drop(['city'], axis=1, inplace=True)
-        df['city_fips'] = pd.NA
-        df['city_name'] = pd.NA
-
-    if not df['county'].isna().values.all():
-        df = pd.concat([df.drop(['county'], axis=1), df['county'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'county_fips', 'name': 'county_name'}, inplace=True)
-    else:
-        df.drop(['county'], axis=1, inplace=True)
-        df['county_fips'] = pd.NA
-        df['county_name'] = pd.NA
+    return _format_location_detail(data, _ZCTA_SCHEMA)
 
-    if not df['state'].isna().values.all():
-        df = pd.concat([df.drop(['state'], axis=1), df['state'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'state_fips', 'name': 'state_name'}, inplace=True)
-    else:
-        df.drop(['state'], axis=1, inplace=True)
-        df['state_fips'] = pd.NA
-        df['state_name'] = pd.NA
 
-    df.rename(columns={'fsid_placeholder': 'fsid', 'name_placeholder': 'name'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['city_fips'] = df['city_fips'].astype('Int64').apply(str)
-    df['county_fips'] = df['county_fips'].astype('Int64').apply(str)
-    df['state_fips'] = df['state_fips'].astype('Int64').apply(str).apply(lambda x: x.zfill(2))
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
-    return df[['fsid', 'valid_id', 'name', 'city_fips', 'city_name', 'county_fips', 'county_name', 'state_fips',
-               'state_name', 'latitude', 'longitude', 'error']]
+_TRACT_SCHEMA = dict(
+    explode=[],
+    locations={'county': ('county_fips', 'county_name'), 'state': ('state_fips', 'state_name')},
+    output=['fsid', 'valid_id', 'fips', 'county_fips', 'county_name', 'state_fips', 'state_name', 'latitude',
+            'longitude', 'error'])
 
 
 def format_location_detail_tract(data):
@@ -958,33 +995,15 @@ def format_location_detail_tract(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data])
-    df.rename(columns={'fsid': 'fsid_placeholder'}, inplace=True)
+    return _format_location_detail(data, _TRACT_SCHEMA)
 
-    if not df['county'].isna().values.all():
-        df = pd.concat([df.drop(['county'], axis=1), df['county'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'county_fips', 'name': 'county_name'}, inplace=True)
-    else:
-        df.drop(['county'], axis=1, inplace=True)
-        df['county_fips'] = pd.NA
-        df['county_name'] = pd.NA
-
-    if not df['state'].isna().values.all():
-        df = pd.concat([df.drop(['state'], axis=1), df['state'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'state_fips', 'name': 'state_name'}, inplace=True)
-    else:
-        df.drop(['state'], axis=1, inplace=True)
-        df['state_fips'] = pd.NA
-        df['state_name'] = pd.NA
 
-    df.rename(columns={'fsid_placeholder': 'fsid', 'name_placeholder': 'name'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['county_fips'] = df['county_fips'].astype('Int64').apply(str)
-    df['state_fips'] = df['state_fips'].astype('Int64').apply(str).apply(lambda x: x.zfill(2))
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
-    return df[['fsid', 'valid_id', 'fips', 'county_fips', 'county_name', 'state_fips', 'state_name',
-               'latitude', 'longitude', 'error']]
+_COUNTY_SCHEMA = dict(
+    explode=['city', 'zcta', 'cd'],
+    locations={'city': ('city_fips', 'city_name'), 'zcta': ('zipCode', 'zcta_name'), 'cd': ('cd_fips', 'cd_name'),
+               'state': ('state_fips', 'state_name')},
+    output=['fsid', 'valid_id', 'name', 'isCoastal', 'city_fips', 'city_name', 'zipCode', 'fips', 'cd_fips', 'cd_name',
+            'state_fips', 'state_name', 'latitude', 'longitude', 'error'])
 
 
 def format_location_detail_county(data):
@@ -995,52 +1014,14 @@ def format_location_detail_county(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data]).explode('city').explode('zcta') \
-        .explode('cd').reset_index(drop=True)
-    df.rename(columns={'fsid': 'fsid_placeholder', 'name': 'name_placeholder'}, inplace=True)
+    return _format_location_detail(data, _COUNTY_SCHEMA)
 
-    if not df['city'].isna().values.all():
-        df = pd.concat([df.drop(['city'], axis=1), df['city'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'city_fips', 'name': 'city_name'}, inplace=True)
-    else:
-        df.drop(['city'], axis=1, inplace=True)
-        df['city_fips'] = pd.NA
-        df['city_name'] = pd.NA
 
-    if not df['zcta'].isna().values.all():
-        df = pd.concat([df.drop(['zcta'], axis=1), df['zcta'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'zipCode', 'name': 'zcta_name'}, inplace=True)
-    else:
-        df.drop(['zcta'], axis=1, inplace=True)
-        df['zipCode'] = pd.NA
-        df['zcta_name'] = pd.NA
-
-    if not df['cd'].isna().values.all():
-        df = pd.concat([df.drop(['cd'], axis=1), df['cd'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'cd_fips', 'name': 'cd_name'}, inplace=True)
-    else:
-        df.drop(['cd'], axis=1, inplace=True)
-        df['cd_fips'] = pd.NA
-        df['cd_name'] = pd.NA
-
-    if not df['state'].isna().values.all():
-        df = pd.concat([df.drop(['state'], axis=1), df['state'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'state_fips', 'name': 'state_name'}, inplace=True)
-    else:
-        df.drop(['state'], axis=1, inplace=True)
-        df['state_fips'] = pd.NA
-        df['state_name'] = pd.NA
-
-    df.rename(columns={'fsid_placeholder': 'fsid', 'name_placeholder': 'name'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['city_fips'] = df['city_fips'].astype('Int64').apply(str)
-    df['zipCode'] = df['zipCode'].astype('Int64').apply(str)
-    df['cd_fips'] = df['cd_fips'].astype('Int64').apply(str)
-    df['state_fips'] = df['state_fips'].astype('Int64').apply(str).apply(lambda x: x.zfill(2))
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
-    return df[['fsid', 'valid_id', 'name', 'isCoastal', 'city_fips', 'city_name', 'zipCode', 'fips', 'cd_fips',
-               'cd_name', 'state_fips', 'state_name', 'latitude', 'longitude', 'error']]
+_CD_SCHEMA = dict(
+    explode=['county'],
+    locations={'county': ('county_fips', 'county_name'), 'state': ('state_fips', 'state_name')},
+    output=['fsid', 'valid_id', 'district', 'county_fips', 'county_name', 'state_fips', 'state_name', 'latitude',
+            'longitude', 'error'])
 
 
 def format_location_detail_cd(data):
@@ -1051,33 +1032,13 @@ def format_location_detail_cd(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data]).explode('county')
-    df.rename(columns={'fsid': 'fsid_placeholder'}, inplace=True)
-
-    if not df['county'].isna().values.all():
-        df = pd.concat([df.drop(['county'], axis=1), df['county'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'county_fips', 'name': 'county_name'}, inplace=True)
-    else:
-        df.drop(['county'], axis=1, inplace=True)
-        df['county_fips'] = pd.NA
-        df['county_name'] = pd.NA
+    return _format_location_detail(data, _CD_SCHEMA)
 
-    if not df['state'].isna().values.all():
-        df = pd.concat([df.drop(['state'], axis=1), df['state'].apply(pd.Series)], axis=1)
-        df.rename(columns={'fsid': 'state_fips', 'name': 'state_name'}, inplace=True)
-    else:
-        df.drop(['state'], axis=1, inplace=True)
-        df['state_fips'] = pd.NA
-        df['state_name'] = pd.NA
 
-    df.rename(columns={'fsid_placeholder': 'fsid'}, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['county_fips'] = df['county_fips'].astype('Int64').apply(str)
-    df['state_fips'] = df['state_fips'].astype('Int64').apply(str).apply(lambda x: x.zfill(2))
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
-    return df[['fsid', 'valid_id', 'district', 'county_fips', 'county_name', 'state_fips', 'state_name',
-               'latitude', 'longitude', 'error']]
+_STATE_SCHEMA = dict(
+    explode=[],
+    locations={},
+    output=['fsid', 'valid_id', 'name', 'fips', 'latitude', 'longitude', 'error'])
 
 
 def format_location_detail_state(data):
@@ -1088,11 +1049,7 @@ def format_location_detail_state(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data])
-    df['fsid'] = df['fsid'].apply(str)
-    df['geometry'] = df['geometry'].apply(get_geom_center)
-    df = pd.concat([df.drop(['geometry'], axis=1), df['geometry'].apply(pd.Series)], axis=1)
-    return df[['fsid', 'valid_id', 'name', 'fips', 'latitude', 'longitude', 'error']]
+    return _format_location_detail(data, _STATE_SCHEMA)
 
 
 def format_location_summary_property(data):
@@ -1103,13 +1060,10 @@ def format_location_summary_property(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data])
-    df['fsid'] = df['fsid'].apply(str)
-    df['riskDirection'] = df['riskDirection'].astype('Int64').apply(str)
-    df['environmentalRisk'] = df['environmentalRisk'].astype('Int64').apply(str)
-    df['historic'] = df['historic'].astype('Int64').apply(str)
-    df['adaptation'] = df['adaptation'].astype('Int64').apply(str)
-    df['floodFactor'] = df['floodFactor'].astype('Int64').apply(str)
+    df = _object_frame(data, ['fsid', 'valid_id', 'floodFactor', 'riskDirection', 'environmentalRisk', 'historic',
+                              'adaptation', 'error'])
+    df['fsid'] = df['fsid'].astype(str)
+    df = _int_str_columns(df, _LOCATION_SUMMARY_PROPERTY_INT_COLS)
     return df[['fsid', 'valid_id', 'floodFactor', 'riskDirection', 'environmentalRisk', 'historic',
                'adaptation', 'error']]
 
@@ -1122,23 +1076,19 @@ def format_location_summary(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data])
+    df = _object_frame(data, ['fsid', 'valid_id', 'riskDirection', 'environmentalRisk', 'properties', 'historic',
+                              'adaptation', 'error'])
 
-    if not df['properties'].isna().values.all():
-        df = pd.concat([df.drop(['properties'], axis=1), df['properties'].apply(pd.Series)], axis=1)
-        df.rename(columns={'total': 'propertiesTotal', 'atRisk': 'propertiesAtRisk'}, inplace=True)
+    if _has_data(data, 'properties'):
+        df = _expand_dict_column(df, 'properties')
+        df = df.rename(columns={'total': 'propertiesTotal', 'atRisk': 'propertiesAtRisk'}, copy=False)
     else:
-        df.drop(['properties'], axis=1, inplace=True)
+        df = df.drop(columns=['properties'])
         df['propertiesTotal'] = pd.NA
         df['propertiesAtRisk'] = pd.NA
 
-    df['fsid'] = df['fsid'].apply(str)
-    df['riskDirection'] = df['riskDirection'].astype('Int64').apply(str)
-    df['environmentalRisk'] = df['environmentalRisk'].astype('Int64').apply(str)
-    df['historic'] = df['historic'].astype('Int64').apply(str)
-    df['adaptation'] = df['adaptation'].astype('Int64').apply(str)
-    df['propertiesTotal'] = df['propertiesTotal'].astype('Int64').apply(str)
-    df['propertiesAtRisk'] = df['propertiesAtRisk'].astype('Int64').apply(str)
+    df['fsid'] = df['fsid'].astype(str)
+    df = _int_str_columns(df, _LOCATION_SUMMARY_INT_COLS)
     return df[['fsid', 'valid_id', 'riskDirection', 'environmentalRisk', 'propertiesTotal',
                'propertiesAtRisk', 'historic', 'adaptation', 'error']]
 
@@ -1151,15 +1101,10 @@ def format_fema_nfip(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.DataFrame([vars(o) for o in data])
-    df['fsid'] = df['fsid'].apply(str)
-    df['claimCount'] = df['claimCount'].astype('Int64').apply(str)
-    df['policyCount'] = df['policyCount'].astype('Int64').apply(str)
-    df['buildingPaid'] = df['buildingPaid'].astype('Int64').apply(str)
-    df['contentPaid'] = df['contentPaid'].astype('Int64').apply(str)
-    df['buildingCoverage'] = df['buildingCoverage'].astype('Int64').apply(str)
-    df['contentCoverage'] = df['contentCoverage'].astype('Int64').apply(str)
-    df['iccPaid'] = df['iccPaid'].astype('Int64').apply(str)
+    df = _object_frame(data, ['fsid', 'valid_id', 'claimCount', 'policyCount', 'buildingPaid', 'contentPaid',
+                              'buildingCoverage', 'contentCoverage', 'iccPaid', 'error'])
+    df['fsid'] = df['fsid'].astype(str)
+    df = _int_str_columns(df, _FEMA_INT_COLS)
     return df[['fsid', 'valid_id', 'claimCount', 'policyCount', 'buildingPaid', 'contentPaid', 'buildingCoverage',
                'contentCoverage', 'iccPaid', 'error']]
 
@@ -1172,43 +1117,45 @@ def format_aal_summary_property(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.json_normalize([vars(o) for o in data]).explode('annual_loss')
+    columns = ['fsid', 'valid_id', 'depth', 'damage', 'year', 'low', 'mid', 'high', 'error']
+    if not data:
+        return pd.DataFrame(columns=columns)
+
+    df = _normalize_objects(data).explode('annual_loss')
     df = df.explode('depth_loss')
 
-    if not df[['annual_loss', 'depth_loss']].isna().values.all():
+    if _has_data(data, 'annual_loss') or _has_data(data, 'depth_loss'):
         def expand_al(al):
             if pd.isnull(al):
                 return pd.NA, pd.NA, pd.NA, pd.NA
             return al['year'], al['data']['low'], al['data']['mid'], al['data']['high']
-        df['year'], df['low'], df['mid'], df['high'] = zip(*df['annual_loss'].apply(expand_al))
-        df.drop(['annual_loss'], axis=1)
+        df['year'], df['low'], df['mid'], df['high'] = zip(*map(expand_al, df['annual_loss'].values))
 
         def expand_dl(dl):
             if pd.isnull(dl):
                 return pd.NA, pd.NA
             return dl['depth'], dl['data']
-        df['depth'], df['damage'] = zip(*df['depth_loss'].apply(expand_dl))
-        df.drop(['depth_loss'], axis=1)
+        df['depth'], df['damage'] = zip(*map(expand_dl, df['depth_loss'].values))
     else:
-        df['fsid'] = df['fsid'].apply(str)
-        df.drop(['annual_loss'], axis=1, inplace=True)
-        df.drop(['depth_loss'], axis=1, inplace=True)
+        df['fsid'] = df['fsid'].astype(str)
+        df = df.drop(columns=['annual_loss'])
+        df = df.drop(columns=['depth_loss'])
         df['depth'] = pd.NA
-        df['data'] = pd.NA
+        df['damage'] = pd.NA
         df['year'] = pd.NA
         df['low'] = pd.NA
         df['mid'] = pd.NA
         df['high'] = pd.NA
 
-    df['fsid'] = df['fsid'].apply(str)
-    df['year'] = df['year'].astype('Int64').apply(str)
-    df['low'] = df['low'].astype('Int64').apply(str)
-    df['mid'] = df['mid'].astype('Int64').apply(str)
-    df['high'] = df['high'].astype('Int64').apply(str)
-    df['depth'] = df['depth'].astype('Int64').apply(str)
-    df['damage'] = df['damage'].astype('Int64').apply(str)
+    df['fsid'] = df['fsid'].astype(str)
+    df['year'] = _int_str(df['year'])
+    df['low'] = _int_str(df['low'])
+    df['mid'] = _int_str(df['mid'])
+    df['high'] = _int_str(df['high'])
+    df['depth'] = _int_str(df['depth'])
+    df['damage'] = _int_str(df['damage'])
 
-    return df[['fsid', 'valid_id', 'depth', 'damage', 'year', 'low', 'mid', 'high', 'error']]
+    return df[columns]
 
 
 def format_aal_summary(data):
@@ -1219,17 +1166,23 @@ def format_aal_summary(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.json_normalize([vars(o) for o in data]).explode('annual_loss')
-
-    if not df[['annual_loss']].isna().values.all():
-        df = pd.concat([df.drop(['annual_loss'], axis=1), df['annual_loss'].apply(pd.Series)], axis=1)
-        df = pd.concat([df.drop(['totalLoss'], axis=1), df['totalLoss'].apply(pd.Series)], axis=1)
-        df.rename(columns={'low': 'total_loss_low', 'mid': 'total_loss_mid', 'high': 'total_loss_high'}, inplace=True)
-        df = pd.concat([df.drop(['count'], axis=1), df['count'].apply(pd.Series)], axis=1)
-        df.rename(columns={'low': 'count_low', 'mid': 'count_mid', 'high': 'count_high'}, inplace=True)
+    columns = ['fsid', 'valid_id', 'year', 'total_loss_low', 'total_loss_mid', 'total_loss_high', 'count_low',
+               'count_mid', 'count_high', 'floodFactor_gr2', 'error']
+    if not data:
+        return pd.DataFrame(columns=columns)
+
+    df = _normalize_objects(data).explode('annual_loss').reset_index(drop=True)
+
+    if _has_data(data, 'annual_loss'):
+        df = _expand_dict_column(df, 'annual_loss')
+        df = _expand_dict_column(df, 'totalLoss')
+        df = df.rename(columns={'low': 'total_loss_low', 'mid': 'total_loss_mid', 'high': 'total_loss_high'},
+                       copy=False)
+        df = _expand_dict_column(df, 'count')
+        df = df.rename(columns={'low': 'count_low', 'mid': 'count_mid', 'high': 'count_high'}, copy=False)
     else:
-        df['fsid'] = df['fsid'].apply(str)
-        df.drop(['annual_loss'], axis=1, inplace=True)
+        df['fsid'] = df['fsid'].astype(str)
+        df = df.drop(columns=['annual_loss'])
         df['year'] = pd.NA
         df['floodFactor'] = pd.NA
         df['total_loss_low'] = pd.NA
@@ -1239,20 +1192,19 @@ def format_aal_summary(data):
         df['count_mid'] = pd.NA
         df['count_high'] = pd.NA
 
-    df.rename(columns={'floodFactor': 'floodFactor_gr2'}, inplace=True)
+    df = df.rename(columns={'floodFactor': 'floodFactor_gr2'}, copy=False)
     df = df.sort_values(by=['fsid', 'floodFactor_gr2', 'year'])
-    df['fsid'] = df['fsid'].apply(str)
-    df['year'] = df['year'].astype('Int64').apply(str)
-    df['floodFactor_gr2'] = df['floodFactor_gr2'].astype('Int64').apply(str)
-    df['total_loss_low'] = df['total_loss_low'].astype('Int64').apply(str)
-    df['total_loss_mid'] = df['total_loss_mid'].astype('Int64').apply(str)
-    df['total_loss_high'] = df['total_loss_high'].astype('Int64').apply(str)
-    df['count_low'] = df['count_low'].astype('Int64').apply(str)
-    df['count_mid'] = df['count_mid'].astype('Int64').apply(str)
-    df['count_high'] = df['count_high'].astype('Int64').apply(str)
+    df['fsid'] = df['fsid'].astype(str)
+    df['year'] = _int_str(df['year'])
+    df['floodFactor_gr2'] = _int_str(df['floodFactor_gr2'])
+    df['total_loss_low'] = _int_str(df['total_loss_low'])
+    df['total_loss_mid'] = _int_str(df['total_loss_mid'])
+    df['total_loss_high'] = _int_str(df['total_loss_high'])
+    df['count_low'] = _int_str(df['count_low'])
+    df['count_mid'] = _int_str(df['count_mid'])
+    df['count_high'] = _int_str(df['count_high'])
 
-    return df[['fsid', 'valid_id', 'year', 'total_loss_low', 'total_loss_mid', 'total_loss_high', 'count_low',
-               'count_mid', 'count_high', 'floodFactor_gr2', 'error']]
+    return df[columns]
 
 
 def format_avm(data):
@@ -1263,21 +1215,25 @@ def format_avm(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.json_normalize([vars(o) for o in data])
+    columns = ['fsid', 'valid_id', 'avm_mid', "provider_id", 'error']
+    if not data:
+        return pd.DataFrame(columns=columns)
+
+    df = _normalize_objects(data)
 
     if 'avm.mid' in df:
-        df.rename(columns={'avm.mid': 'avm_mid'}, inplace=True)
+        df = df.rename(columns={'avm.mid': 'avm_mid'}, copy=False)
     else:
-        df['fsid'] = df['fsid'].apply(str)
+        df['fsid'] = df['fsid'].astype(str)
         df['avm_mid'] = pd.NA
 
     if 'avm' in df:
-        df.drop(['avm'], axis=1, inplace=True)
-    df['fsid'] = df['fsid'].apply(str)
-    df['avm_mid'] = df['avm_mid'].astype('Int64').apply(str)
-    df['provider_id'] = df['provider_id'].astype('Int64').apply(str)
+        df = df.drop(columns=['avm'])
+    df['fsid'] = df['fsid'].astype(str)
+    df['avm_mid'] = _int_str(df['avm_mid'])
+    df['provider_id'] = _int_str(df['provider_id'])
 
-    return df[['fsid', 'valid_id', 'avm_mid', "provider_id", 'error']]
+    return df[columns]
 
 
 def format_avm_provider(data):
@@ -1288,11 +1244,15 @@ def format_avm_provider(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.json_normalize([vars(o) for o in data])
+    columns = ['provider_id', 'valid_id', 'provider_name', "provider_logo", 'error']
+    if not data:
+        return pd.DataFrame(columns=columns)
 
-    df['provider_id'] = df['provider_id'].astype('Int64').apply(str)
+    df = _normalize_objects(data)
 
-    return df[['provider_id', 'valid_id', 'provider_name', "provider_logo", 'error']]
+    df['provider_id'] = _int_str(df['provider_id'])
+
+    return df[columns]
 
 
 def format_economic_nfip_premium(data):
@@ -1303,19 +1263,63 @@ def format_economic_nfip_premium(data):
     Returns:
         A pandas formatted DataFrame
     """
-    df = pd.json_normalize([vars(o) for o in data]).explode("data")
+    columns = ['fsid', 'valid_id', 'estimate', "building", 'contents', 'error']
+    if not data:
+        return pd.DataFrame(columns=columns)
+
+    df = _normalize_objects(data).explode("data").reset_index(drop=True)
 
-    if not df[['data']].isna().values.all():
-        df = pd.concat([df.drop(['data'], axis=1), df['data'].apply(pd.Series)], axis=1)
+    if _has_data(data, 'data'):
+        df = _expand_dict_column(df, 'data')
     else:
-        df.drop(['data'], axis=1, inplace=True)
+        df = df.drop(columns=['data'])
         df['estimate'] = pd.NA
         df['building'] = pd.NA
         df['contents'] = pd.NA
 
-    df['fsid'] = df['fsid'].apply(str)
-    df['estimate'] = df['estimate'].astype('Int64').apply(str)
-    df['building'] = df['building'].astype('Int64').apply(str)
-    df['contents'] = df['contents'].astype('Int64').apply(str)
-
-    return df[['fsid', 'valid_id', 'estimate', "building", 'contents', 'error']]
+    df['fsid'] = df['fsid'].astype(str)
+    df['estimate'] = _int_str(df['estimate'])
+    df['building'] = _int_str(df['building'])
+    df['contents'] = _int_str(df['contents'])
+
+    return df[columns]
+
+
+# Formatters keyed by product, product subtype, and location type. A location type of None matches any location type
+# without a more specific entry
+_FORMATTERS = {
+    ('adaptation', 'detail', None): format_adaptation_detail,
+    ('adaptation', 'summary', None): format_adaptation_summary,
+    ('adaptation', 'summary_detail', None): format_adaptation_summary_detail,
+    ('probability', 'chance', None): format_probability_chance,
+    ('probability', 'count', None): format_probability_count,
+    ('probability', 'count-summary', None): format_probability_count_summary,
+    ('probability', 'cumulative', None): format_probability_cumulative,
+    ('probability', 'depth', None): format_probability_depth,
+    ('environmental', 'precipitation', None): format_environmental_precipitation,
+    ('historic', 'event', None): format_historic_event,
+    ('historic', 'summary', 'property'): format_historic_summary_property,
+    ('historic', 'summary', None): format_historic_summary,
+    ('historic', 'summary_event', 'property'): format_historic_summary_event_property,
+    ('historic', 'summary_event', None): format_historic_summary_event,
+    ('location', 'detail', 'property'): format_location_detail_property,
+    ('location', 'detail', 'neighborhood'): format_location_detail_neighborhood,
+    ('location', 'detail', 'city'): format_location_detail_city,
+    ('location', 'detail', 'zcta'): format_location_detail_zcta,
+    ('location', 'detail', 'tract'): format_location_detail_tract,
+    ('location', 'detail', 'county'): format_location_detail_county,
+    ('location', 'detail', 'cd'): format_location_detail_cd,
+    ('location', 'detail', 'state'): format_location_detail_state,
+    ('location', 'summary', 'property'): format_location_summary_property,
+    ('location', 'summary', None): format_location_summary,
+    ('fema', 'nfip', None): format_fema_nfip,
+    ('economic_aal', 'summary', 'property'): format_aal_summary_property,
+    ('economic_aal', 'summary', None): format_aal_summary,
+    ('economic_avm', 'avm', None): format_avm,
+    ('economic_avm', 'provider', None): format_avm_provider,
+    ('economic', 'nfip', None): format_economic_nfip_premium,
+}
+
+_WRITERS = {
+    ('historic', 'event', None): write_historic_event,
+}
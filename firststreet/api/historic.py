@@ -2,7 +2,9 @@
 # Copyright: This module is owned by First Street Foundation
 
 # Standard Imports
+import collections
 import logging
+import urllib.parse
 
 # Internal Imports
 from firststreet.api import csv_format
@@ -10,15 +12,32 @@ from firststreet.api.api import Api
 from firststreet.errors import InvalidArgument
 from firststreet.models.historic import HistoricEvent, HistoricSummary
 
+# Default max number of Historic Events kept by a Historic client for reuse
+EVENT_CACHE_SIZE = 1000
+
 
 class Historic(Api):
     """This class receives a list of search_items and handles the creation of a historic product from the request.
 
+        Attributes:
+            event_cache_size (int): The max number of Historic Events kept for reuse by get_events_by_location, or 0
+                to not keep any
         Methods:
             get_event: Retrieves a list of Historic Event for the given list of IDs
             get_summary: Retrieves a list of Historic Summary for the given list of IDs
+            clear_event_cache: Removes the Historic Events kept for reuse
         """
 
+    def __init__(self, http, event_cache_size=EVENT_CACHE_SIZE):
+        """ Init"""
+        super().__init__(http)
+        self.event_cache_size = event_cache_size
+        self._events = collections.OrderedDict()
+
+    def clear_event_cache(self):
+        """Removes the Historic Events kept for reuse by get_events_by_location"""
+        self._events.clear()
+
     def get_event(self, search_items, csv=False, output_dir=None, extra_param=None):
         """Retrieves historic event product data from the First Street Foundation API given a list of search_items and
         returns a list of Historic Event objects.
@@ -35,8 +54,7 @@ class Historic(Api):
         """
 
         # Get data from api and create objects
-        api_datas = self.call_api(search_items, "historic", "event", None, extra_param=extra_param)
-        product = [HistoricEvent(api_data) for api_data in api_datas]
+        product = self.call_api(search_items, "historic", "event", None, extra_param=extra_param, model=HistoricEvent)
 
         if csv:
             csv_format.to_csv(product, "historic", "event", output_dir=output_dir)
@@ -45,9 +63,11 @@ class Historic(Api):
 
         return product
 
-    def get_events_by_location(self, search_items, location_type, csv=False, output_dir=None, extra_param=None):
+    def get_events_by_location(self, search_items, location_type, csv=False, output_dir=None, extra_param=None,
+                               use_cache=True):
         """Retrieves historic summary product data from the First Street Foundation API given a list of location
-        search_items and returns a list of Historic Summary objects.
+        search_items and returns a list of Historic Summary objects. Historic Events retrieved by earlier calls are
+        reused, and are the same objects, unless use_cache is False.
 
         Args:
             search_items (list/file): A First Street Foundation IDs, lat/lng pair, address, or a
@@ -56,6 +76,7 @@ class Historic(Api):
             csv (bool): To output extracted data to a csv or not
             output_dir (str): The output directory to save the generated csvs
             extra_param (dict): Extra parameter to be added to the url
+            use_cache (bool): To reuse and keep the Historic Events retrieved across calls or not
 
         Returns:
             A list of Historic Event
@@ -70,19 +91,16 @@ class Historic(Api):
             raise TypeError("location is not a string")
 
         # Get data from api and create objects
-        api_datas = self.call_api(search_items, "historic", "summary", location_type)
-        summary = [HistoricSummary(api_data) for api_data in api_datas]
+        summary = self.call_api(search_items, "historic", "summary", location_type, model=HistoricSummary)
 
-        search_item = list(set([event.get("eventId") for sum_hist in summary if sum_hist.historic for
-                                event in sum_hist.historic]))
+        search_item = list(dict.fromkeys(event.get("eventId") for sum_hist in summary if sum_hist.historic for
+                                         event in sum_hist.historic if event.get("eventId") is not None))
 
         if search_item:
-            api_datas_event = self.call_api(search_item, "historic", "event", None, extra_param=extra_param)
+            event = self._get_events(search_item, extra_param=extra_param, use_cache=use_cache)
 
         else:
-            api_datas_event = [{"eventId": None, "valid_id": False}]
-
-        event = [HistoricEvent(api_data) for api_data in api_datas_event]
+            event = [HistoricEvent({"eventId": None, "valid_id": False})]
 
         if csv:
             csv_format.to_csv([summary, event], "historic", "summary_event", location_type, output_dir=output_dir)
@@ -91,6 +109,47 @@ class Historic(Api):
 
         return [summary, event]
 
+    def _get_events(self, event_ids, extra_param=None, use_cache=True):
+        """Retrieves the Historic Event for each of the given event IDs, only calling the API for the events that were
+        not already retrieved with the same extra parameters. Up to event_cache_size events are kept, dropping the
+        least recently used ones first. Events that failed to retrieve are not kept.
+
+        Args:
+            event_ids (list): A list of unique event IDs
+            extra_param (dict): Extra parameter to be added to the url
+            use_cache (bool): To reuse and keep the retrieved events or not
+
+        Returns:
+            A list of Historic Event, in the order of the event IDs
+        """
+
+        params = urllib.parse.urlencode(extra_param) if extra_param else ""
+        events = {}
+
+        if use_cache:
+            for event_id in event_ids:
+                key = (event_id, params)
+                if key in self._events:
+                    self._events.move_to_end(key)
+                    events[event_id] = self._events[key]
+
+        missing = [event_id for event_id in event_ids if event_id not in events]
+        if missing:
+            fetched = self.call_api(missing, "historic", "event", None, extra_param=extra_param, model=HistoricEvent)
+
+            for event_id, event in zip(missing, fetched):
+                events[event_id] = event
+
+                # Failed requests come back without the event, so only keep the events that were actually retrieved
+                if use_cache and self.event_cache_size > 0 and event.valid_id and event.error is None and \
+                        event.eventId == str(event_id):
+                    self._events[(event_id, params)] = event
+
+                    if len(self._events) > self.event_cache_size:
+                        self._events.popitem(last=False)
+
+        return [events[event_id] for event_id in event_ids]
+
     def get_summary(self, search_items, location_type, csv=False, output_dir=None, extra_param=None):
         """Retrieves historic summary product data from the First Street Foundation API given a list of search_items and
         returns a list of Historic Summary objects.
@@ -116,8 +175,8 @@ class Historic(Api):
             raise TypeError("location is not a string")
 
         # Get data from api and create objects
-        api_datas = self.call_api(search_items, "historic", "summary", location_type, extra_param=extra_param)
-        product = [HistoricSummary(api_data) for api_data in api_datas]
+        product = self.call_api(search_items, "historic", "summary", location_type, extra_param=extra_param,
+                                model=HistoricSummary)
 
         if csv:
             csv_format.to_csv(product, "historic", "summary", location_type, output_dir=output_dir)
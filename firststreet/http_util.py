@@ -58,16 +58,23 @@ class Http:
         self.rate_limit = rate_limit
         self.rate_period = rate_period
 
-    async def bound_fetch(self, sem, endpoint, session, throttler):
+    async def bound_fetch(self, sem, endpoint, session, throttler, model=None):
         async with sem:
-            return await self.execute(endpoint, session, throttler)
+            response = await self.execute(endpoint, session, throttler)
 
-    async def endpoint_execute(self, endpoints):
+        # Build the object as soon as its response arrives, while the other requests are still in flight
+        if model is not None:
+            return model(response)
+
+        return response
+
+    async def endpoint_execute(self, endpoints, model=None):
         """Asynchronously calls each endpoint and returns the JSON responses
         Args:
             endpoints (list): List of endpoints to get
+            model (class/None): A model to create from each JSON response as it is received
         Returns:
-            The list of JSON responses corresponding to each endpoint
+            The list of JSON responses, or of model objects, corresponding to each endpoint
         """
 
         throttler = Throttler(rate_limit=self.rate_limit, period=self.rate_period)
@@ -80,7 +87,8 @@ class Http:
         try:
 
             sem = asyncio.Semaphore(self.connection_limit)
-            tasks = [asyncio.create_task(self.bound_fetch(sem, endpoint, session, throttler)) for endpoint in endpoints]
+            tasks = [asyncio.create_task(self.bound_fetch(sem, endpoint, session, throttler, model))
+                     for endpoint in endpoints]
 
             [await f for f in tqdm.tqdm(asyncio.as_completed(tasks), total=len(endpoints))]
             ret = [t.result() for t in tasks]
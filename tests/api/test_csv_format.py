@@ -0,0 +1,187 @@
+# Author: Kelvin Lai <kelvin@firststreet.org>
+# Copyright: This module is owned by First Street Foundation
+
+# Standard Imports
+import io
+import math
+
+# External Imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Internal Imports
+from firststreet.api import csv_format
+from firststreet.models.adaptation import AdaptationDetail
+from firststreet.models.historic import HistoricEvent
+from firststreet.models.probability import ProbabilityChance, ProbabilityCountSummary
+
+VALID_EVENT = {"eventId": 1, "name": "Flood", "month": 5, "year": 2010, "returnPeriod": 100, "type": "flood",
+               "properties": {"total": 10, "affected": 3},
+               "geometry": {"center": {"type": "Point", "coordinates": [-80.5, 40.25]}}}
+PARTIAL_EVENT = {"eventId": 2, "name": "Storm", "year": 2012, "type": "hurricane"}
+PARTIAL_PROPERTIES_EVENT = {"eventId": 5, "name": "Rain", "month": 7, "properties": {"total": 3}}
+INVALID_EVENT = {"eventId": 3, "valid_id": False}
+ERROR_EVENT = {"eventId": 4, "valid_id": False, "error": "Network Error"}
+
+
+class TestHistoricEventWriter:
+
+    @pytest.mark.parametrize("responses", [
+        [VALID_EVENT],
+        [VALID_EVENT, PARTIAL_EVENT],
+        [VALID_EVENT, PARTIAL_PROPERTIES_EVENT],
+        [PARTIAL_PROPERTIES_EVENT, PARTIAL_EVENT],
+        [VALID_EVENT, INVALID_EVENT],
+        [VALID_EVENT, PARTIAL_EVENT, INVALID_EVENT, ERROR_EVENT],
+        [ERROR_EVENT],
+    ])
+    def test_matches_frame(self, responses):
+        data = [HistoricEvent(response) for response in responses]
+
+        written = io.StringIO()
+        csv_format.write_historic_event(data, written)
+
+        framed = io.StringIO()
+        csv_format.write_frame(csv_format.format_historic_event(data), framed)
+
+        assert written.getvalue() == framed.getvalue()
+
+    def test_status_columns(self):
+        written = io.StringIO()
+        csv_format.write_historic_event([HistoricEvent(VALID_EVENT), HistoricEvent(ERROR_EVENT)], written)
+        header, valid, error = written.getvalue().splitlines()
+        assert header.split(",") == csv_format._HISTORIC_EVENT_COLUMNS
+        assert valid.split(",")[1] == "True"
+        assert error.split(",")[1:3] == ["False", "<NA>"]
+        assert error.split(",")[-1] == "Network Error"
+
+        written = io.StringIO()
+        csv_format.write_historic_event([HistoricEvent(VALID_EVENT)], written)
+        assert "valid_id" not in written.getvalue().splitlines()[0]
+        assert "error" not in written.getvalue().splitlines()[0]
+
+
+class TestProductRows:
+
+    def test_product(self):
+        rows = list(csv_format._product_rows([(1, ["a", "b"], [10, 20], "x")], [1, 2]))
+        assert rows == [[1, "a", 10, "x"], [1, "a", 20, "x"], [1, "b", 10, "x"], [1, "b", 20, "x"]]
+
+    def test_scalars_kept(self):
+        rows = list(csv_format._product_rows([(1, "a", None)], [1, 2]))
+        assert rows == [[1, "a", None]]
+
+    def test_empty_list(self):
+        rows = list(csv_format._product_rows([(1, [], ["c"]), (2, None, [])], [1, 2]))
+        assert len(rows) == 2
+        assert rows[0][0] == 1 and math.isnan(rows[0][1]) and rows[0][2] == "c"
+        assert rows[1][0] == 2 and rows[1][1] is None and math.isnan(rows[1][2])
+
+    def test_adaptation_detail(self):
+        data = [AdaptationDetail({"adaptationId": 1, "name": "Wall", "type": ["wall", "levee"], "scenario": ["s1"],
+                                  "serving": {key: [1] for key in ["property", "neighborhood", "zcta", "tract",
+                                                                   "city", "county", "cd", "state"]}}),
+                AdaptationDetail({"adaptationId": 2, "name": "Dam", "type": [], "scenario": ["s1", "s2"]})]
+        df = csv_format.format_adaptation_detail(data)
+        assert list(df['adaptationId']) == ["1", "1", "2", "2"]
+        assert list(df['type'].iloc[:2]) == ["wall", "levee"]
+        assert df['type'].iloc[2:].isnull().all()
+        assert list(df['scenario']) == ["s1", "s1", "s1", "s2"]
+        assert list(df['serving_state'].iloc[:2]) == [[1], [1]]
+        assert pd.isna(df['serving_state'].iloc[2])
+
+
+class TestMissingValues:
+
+    def test_frame(self):
+        df = pd.DataFrame({"fsid": ["1", "2", "3", "4"], "valid_id": [True, True, True, True],
+                           "value": [1.5, np.nan, None, pd.NA], "name": ["a", None, np.nan, pd.NA]})
+        written = io.StringIO()
+        csv_format.write_frame(df, written)
+        assert written.getvalue().splitlines() == ["fsid,value,name", "1,1.5,a", "2,<NA>,<NA>", "3,<NA>,<NA>",
+                                                   "4,<NA>,<NA>"]
+
+    def test_to_csv(self, tmp_path):
+        data = [ProbabilityChance({"fsid": 1, "chance": [{"year": 2020, "data": [
+                    {"threshold": 0, "data": {"low": 0.1, "mid": None, "high": 0.3}}]}]}),
+                ProbabilityChance({"fsid": 2, "valid_id": False})]
+        csv_format.to_csv(data, "probability", "chance", output_dir=str(tmp_path))
+        lines = next(tmp_path.iterdir()).read_text().splitlines()
+        assert lines == ["fsid,valid_id,year,threshold,low,mid,high", "1,True,2020,0,0.1,<NA>,0.3",
+                         "2,False,<NA>,<NA>,<NA>,<NA>,<NA>"]
+
+
+class TestCountSummary:
+
+    def test_rows(self):
+        data = [ProbabilityCountSummary({"fsid": 1, "state": None, "city": [], "county": [
+                    {"fsid": 19047, "name": "Crawford", "count": [{"year": 2020, "data": {"low": 1, "mid": 2,
+                                                                                           "high": 3}}]}]}),
+                ProbabilityCountSummary({"fsid": 2, "state": [], "city": []}),
+                ProbabilityCountSummary({"fsid": 3, "valid_id": False})]
+        df = csv_format.format_probability_count_summary(data)
+        assert list(df['fsid']) == ["1", "2", "3"]
+        assert list(df.iloc[0][['location', 'location_fips', 'location_name', 'year', 'low', 'mid', 'high']]) == \
+            ["county", "19047", "Crawford", "2020", "1", "2", "3"]
+        assert df.iloc[1:][['location', 'location_fips', 'year', 'low']].isnull().all().all()
+        assert list(df['valid_id']) == [True, True, False]
+
+
+class TestExpandLocations:
+
+    def test_expand(self):
+        df = pd.DataFrame({"fsid": ["1", "2", "3"],
+                           "county": [{"fsid": 19047, "name": "Crawford"}, None, {"name": "Lake"}],
+                           "state": [{"fsid": 39, "name": "Ohio"}, {"fsid": 19, "name": "Iowa"}, np.nan]})
+        df = csv_format._expand_locations(df, {"county": ("county_fips", "county_name"),
+                                               "state": ("state_fips", "state_name")})
+        assert list(df.columns) == ["fsid", "county_fips", "county_name", "state_fips", "state_name"]
+        assert list(df['county_fips'].fillna(0)) == [19047, 0, 0]
+        assert list(df['county_name'].fillna("")) == ["Crawford", "", "Lake"]
+        assert list(df['state_fips'].fillna(0)) == [39, 19, 0]
+        assert list(df['state_name'].fillna("")) == ["Ohio", "Iowa", ""]
+
+
+class TestStateFips:
+
+    def test_padding(self):
+        fips = csv_format._state_fips_str(pd.Series([1, 39, 0, None, 6.0]))
+        assert list(fips.fillna("")) == ["01", "39", "00", "", "06"]
+        assert fips.dtype == "string"
+
+    def test_outside_table(self):
+        fips = csv_format._state_fips_str(pd.Series([1, 123, None]))
+        assert list(fips.fillna("")) == ["01", "123", ""]
+
+    def test_index(self):
+        fips = csv_format._state_fips_str(pd.Series([5, 72], index=[3, 1]))
+        assert list(fips.index) == [3, 1]
+        assert list(fips) == ["05", "72"]
+
+    def test_empty(self):
+        assert csv_format._state_fips_str(pd.Series([], dtype=float)).empty
+
+
+class TestEmptyData:
+
+    @pytest.mark.parametrize("key", list(csv_format._FORMATTERS))
+    def test_formatter(self, key):
+        data = [[], []] if key[1] in ("summary_detail", "summary_event") else []
+        df = csv_format._FORMATTERS[key](data)
+        assert df.empty
+        assert len(df.columns)
+
+    @pytest.mark.parametrize("product, product_subtype, location_type, header", [
+        ("adaptation", "detail", None, "adaptationId,name"),
+        ("historic", "summary", "city", "fsid,eventId"),
+        ("economic_aal", "summary", None, "fsid,year"),
+        ("economic_avm", "provider", None, "provider_id,provider_name"),
+        ("historic", "event", None, "eventId,name"),
+    ])
+    def test_to_csv(self, tmp_path, product, product_subtype, location_type, header):
+        csv_format.to_csv([], product, product_subtype, location_type, output_dir=str(tmp_path))
+        lines = next(tmp_path.iterdir()).read_text().splitlines()
+        assert len(lines) == 1
+        assert lines[0].startswith(header)
+        assert "valid_id" not in lines[0]
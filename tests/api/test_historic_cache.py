@@ -0,0 +1,146 @@
+# Author: Kelvin Lai <kelvin@firststreet.org>
+# Copyright: This module is owned by First Street Foundation
+
+# Internal Imports
+from firststreet import Http
+from firststreet.api.historic import Historic
+from firststreet.models.historic import HistoricEvent, HistoricSummary
+
+
+class StubApi:
+    """Stands in for Api.call_api, answering from canned responses and recording the requested search items"""
+
+    def __init__(self, summaries=None, invalid=(), failed=(), errors=()):
+        self.summaries = summaries or []
+        self.invalid = invalid
+        self.failed = failed
+        self.errors = errors
+        self.calls = []
+
+    def __call__(self, search_item, product, product_subtype, location=None, extra_param=None, model=None):
+        self.calls.append((product_subtype, list(search_item), extra_param))
+
+        if product_subtype == "summary":
+            return [model(summary) for summary in self.summaries]
+
+        return [self.event(model, event_id) for event_id in search_item]
+
+    def event(self, model, event_id):
+        if event_id in self.invalid:
+            return model({"eventId": event_id, "valid_id": False})
+
+        if event_id in self.failed:
+            return model({"search_item": event_id})
+
+        if event_id in self.errors:
+            return model({"eventId": event_id, "error": "Network Error"})
+
+        return model({"eventId": event_id, "name": "Event {}".format(event_id)})
+
+
+def historic_with(stub, **kwargs):
+    historic = Historic(Http("", 1, 1, 1), **kwargs)
+    historic.call_api = stub
+    return historic
+
+
+class TestHistoricEventCache:
+
+    def test_cache_hit(self):
+        stub = StubApi()
+        historic = historic_with(stub)
+        first = historic._get_events([1, 2])
+        second = historic._get_events([2, 3])
+        assert stub.calls == [("event", [1, 2], None), ("event", [3], None)]
+        assert second[0] is first[1]
+        assert [event.eventId for event in second] == ["2", "3"]
+
+    def test_extra_param_keys(self):
+        stub = StubApi()
+        historic = historic_with(stub)
+        historic._get_events([1])
+        historic._get_events([1], extra_param={"a": 1})
+        historic._get_events([1], extra_param={"a": 2})
+        historic._get_events([1], extra_param={"a": 1})
+        assert [call[1] for call in stub.calls] == [[1], [1], [1]]
+
+    def test_invalid_not_cached(self):
+        stub = StubApi(invalid=(2,))
+        historic = historic_with(stub)
+        events = historic._get_events([1, 2])
+        assert not events[1].valid_id
+        historic._get_events([1, 2])
+        assert [call[1] for call in stub.calls] == [[1, 2], [2]]
+
+    def test_failed_not_cached(self):
+        stub = StubApi(failed=(5,), errors=(6,))
+        historic = historic_with(stub)
+        events = historic._get_events([4, 5, 6])
+        assert events[1].eventId == "None"
+        assert events[2].error == "Network Error"
+        historic._get_events([4, 5, 6])
+        assert [call[1] for call in stub.calls] == [[4, 5, 6], [5, 6]]
+        assert list(historic._events) == [(4, "")]
+
+    def test_size_bound(self):
+        stub = StubApi()
+        historic = historic_with(stub, event_cache_size=2)
+        historic._get_events([1, 2])
+        historic._get_events([1])
+        historic._get_events([3])
+        assert list(historic._events) == [(1, ""), (3, "")]
+        historic._get_events([2])
+        assert [call[1] for call in stub.calls] == [[1, 2], [3], [2]]
+
+    def test_disabled(self):
+        stub = StubApi()
+        historic = historic_with(stub, event_cache_size=0)
+        historic._get_events([1])
+        historic._get_events([1])
+        assert len(stub.calls) == 2
+        assert not historic._events
+
+    def test_use_cache_false(self):
+        stub = StubApi()
+        historic = historic_with(stub)
+        first = historic._get_events([1])
+        second = historic._get_events([1], use_cache=False)
+        assert len(stub.calls) == 2
+        assert second[0] is not first[0]
+        assert historic._events[(1, "")] is first[0]
+
+    def test_clear(self):
+        stub = StubApi()
+        historic = historic_with(stub)
+        historic._get_events([1])
+        historic.clear_event_cache()
+        historic._get_events([1])
+        assert len(stub.calls) == 2
+
+    def test_events_by_location(self):
+        stub = StubApi(summaries=[{"fsid": 7, "historic": [{"eventId": 1}, {"eventId": 2}]},
+                                  {"fsid": 8, "historic": [{"eventId": 2}]}])
+        historic = historic_with(stub)
+        summary, event = historic.get_events_by_location([7, 8], "city")
+        historic.get_events_by_location([7, 8], "city")
+        assert all(isinstance(s, HistoricSummary) for s in summary)
+        assert all(isinstance(e, HistoricEvent) for e in event)
+        assert [e.eventId for e in event] == ["1", "2"]
+        assert [call[0] for call in stub.calls] == ["summary", "event", "summary"]
+
+    def test_events_by_location_skips_missing_ids(self):
+        stub = StubApi(summaries=[{"fsid": 7, "historic": [{"eventId": None}, {"eventId": 1}, {}]},
+                                  {"fsid": 8, "historic": None}])
+        historic = historic_with(stub)
+        summary, event = historic.get_events_by_location([7, 8], "city")
+        assert stub.calls[1] == ("event", [1], None)
+        assert [e.eventId for e in event] == ["1"]
+
+    def test_events_by_location_no_ids(self):
+        stub = StubApi(summaries=[{"fsid": 7, "historic": [{"eventId": None}]}, {"fsid": 8, "historic": []}])
+        historic = historic_with(stub)
+        summary, event = historic.get_events_by_location([7, 8], "city")
+        assert [call[0] for call in stub.calls] == ["summary"]
+        assert len(event) == 1
+        assert event[0].eventId == "None"
+        assert not event[0].valid_id